@@ -73,7 +73,10 @@ function doPost(e) {
     }
 
     // ── Action: add_feedback (default) ────────────────────
-    var id = payload.id || (Date.now().toString(36) + Math.random().toString(36).slice(2, 7));
+    // Same layout as the clients' ids: ms (8) + counter (2) + random (3)
+    // (fixed width, so ids sort by time; random part like base36() in feedbackStore.js)
+    var id = payload.id || (Date.now().toString(36).padStart(8, "0") + "00" +
+      Math.floor(Math.random() * Math.pow(36, 3)).toString(36).padStart(3, "0"));
     var row = [
       id,
       payload.page_id || "",
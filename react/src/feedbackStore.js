@@ -17,8 +17,29 @@ function saveLocal(data) {
   localStorage.setItem(STORAGE_KEY, JSON.stringify(data));
 }
 
-const nextId = () =>
-  Date.now().toString(36) + Math.random().toString(36).slice(2, 7);
+// Time-sortable id (same scheme as streamlit/lib/feedback_ids.py):
+// 8 base36 chars epoch ms + 2 chars counter within the ms + 3 random chars.
+// Fixed width, so string order = creation order.
+let _lastMs = 0;
+let _counter = 0;
+
+const base36 = (value, width) => value.toString(36).padStart(width, "0");
+
+const nextId = () => {
+  let ms = Date.now();
+  if (ms <= _lastMs) {
+    ms = _lastMs;
+    _counter += 1;
+    if (_counter >= 36 * 36) {
+      ms += 1;
+      _counter = 0;
+    }
+  } else {
+    _counter = 0;
+  }
+  _lastMs = ms;
+  return base36(ms, 8) + base36(_counter, 2) + base36(Math.floor(Math.random() * 36 ** 3), 3);
+};
 
 // ── Google Sheets sync helpers ──────────────────────────────
 
@@ -4,8 +4,14 @@ Dashboard Prototyper — Streamlit Variant
 Iterative dashboard prototyping with built-in feedback collection.
 Premium styling with HTML KPI cards and custom CSS.
 """
+import time
+
 import streamlit as st
 
+# Timed until the end of the script (incl. module reloads) as "app.full_run";
+# feedback interactions rerun only their fragment ("fragment.*" in perf)
+_run_started = time.perf_counter()
+
 st.set_page_config(
     page_title="Dashboard Prototyper — Streamlit",
     page_icon="📋",
@@ -13,32 +19,76 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# ── Reload all modules to bust .pyc cache on Streamlit Cloud ────
+# ── Reload changed modules to bust .pyc cache on Streamlit Cloud ──
+# Only modules whose source changed since the last rerun are reloaded
+# (see lib/reloader.py); order matters — dependencies first.  Lazy modules
+# (pages, gspread client) are imported on first use, not at startup.
 import importlib
-import lib.mock_data, lib.theme, lib.feedback_db, lib.feedback_ui
-importlib.reload(lib.mock_data)
-importlib.reload(lib.theme)
-importlib.reload(lib.feedback_db)
-importlib.reload(lib.feedback_ui)
-
-import pages.exec_summary, pages.market_uptake, pages.regional_view, pages.feedback_overview
-importlib.reload(pages.exec_summary)
-importlib.reload(pages.market_uptake)
-importlib.reload(pages.regional_view)
-importlib.reload(pages.feedback_overview)
+from lib import reloader
 
+LAZY_MODULES = {
+    "lib.sheets_client",
+    "pages.performance",
+    "pages.exec_summary",
+    "pages.market_uptake",
+    "pages.regional_view",
+    "pages.feedback_overview",
+}
+reloaded = reloader.refresh([
+    "lib.settings",
+    "lib.perf",
+    "lib.data_cache",
+    "lib.mock_data",
+    "lib.theme",
+    "lib.figure_cache",
+    "lib.sheets_client",
+    "lib.feedback_backends",
+    "lib.feedback_queue",
+    "lib.feedback_journal",
+    "lib.feedback_ids",
+    "lib.feedback_index",
+    "lib.feedback_search",
+    "lib.shared_cache",
+    "lib.feedback_db",
+    "lib.feedback_export",
+    "lib.feedback_ui",
+    "pages.exec_summary",
+    "pages.market_uptake",
+    "pages.regional_view",
+    "pages.feedback_overview",
+    "pages.performance",
+], lazy=LAZY_MODULES)
+if reloaded:
+    # Cached figures and table HTML were built by the code before the reload
+    from lib import figure_cache, theme
+    figure_cache.clear()
+    theme.clear_table_cache()
+
+from lib import perf
 from lib.theme import CUSTOM_CSS
-from pages.exec_summary import show as exec_show
-from pages.market_uptake import show as uptake_show
-from pages.regional_view import show as regional_show
-from pages.feedback_overview import show as feedback_show
+
+
+def lazy_page(module_name: str):
+    """Page callable that imports its module (and e.g. plotly) on first visit."""
+    def run():
+        with perf.timer(f"page.{module_name.rsplit('.', 1)[-1]}"):
+            importlib.import_module(module_name).show()
+    run.__name__ = module_name.rsplit(".", 1)[-1]
+    return run
+
 
 # ── Custom CSS (after reload) ───────────────────────────────────
 st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
-# ── Sidebar ───────────────────────────────────────────────────
-from lib import feedback_db
+# ── Feedback prefetch ─────────────────────────────────────────
+# The snapshot loads in the background while the page draws KPIs and
+# charts; only the feedback widgets (sidebar stats, popovers) wait for it.
+from lib import feedback_db, feedback_ui
+from lib.feedback_backends import get_backend
 
+feedback_ui.start_prefetch()
+
+# ── Sidebar ───────────────────────────────────────────────────
 with st.sidebar:
     st.markdown("""
     <div style="margin-bottom:8px">
@@ -52,31 +102,52 @@ with st.sidebar:
     """, unsafe_allow_html=True)
 
     st.markdown("---")
+    sidebar_feedback = st.container()  # filled after the page, see below
+
+# ── Page Navigation ───────────────────────────────────────────
+exec_page = st.Page(lazy_page("pages.exec_summary"), title="Executive Summary", icon="📊", url_path="exec", default=True)
+uptake_page = st.Page(lazy_page("pages.market_uptake"), title="Markt-Uptake", icon="📈", url_path="uptake")
+regional_page = st.Page(lazy_page("pages.regional_view"), title="Regionale Performance", icon="🗺", url_path="regional")
+feedback_page = st.Page(lazy_page("pages.feedback_overview"), title="Feedback-Übersicht", icon="💬", url_path="feedback")
+perf_page = st.Page(lazy_page("pages.performance"), title="Performance", icon="⏱", url_path="performance")
+
+nav = st.navigation(
+    {
+        "Dashboard": [exec_page, uptake_page, regional_page],
+        "Admin": [feedback_page, perf_page],
+    }
+)
+nav.run()
 
+# ── Sidebar: round + feedback stats (waits for the snapshot) ──
+# The selectbox is keyed "current_round", so pages read the selected round
+# from session state even though it is drawn after them.
+with sidebar_feedback:
     max_round = feedback_db.get_max_round()
     round_options = list(range(1, max_round + 2))
+    round_counts = feedback_db.get_round_counts()
 
-    current_round = st.selectbox(
+    st.selectbox(
         "🔄 Aktuelle Runde",
         options=round_options,
         index=0,
-        format_func=lambda x: f"Runde {x}" + (" ← neu" if x > max_round else f" ({len(feedback_db.get_feedback(round_num=x))} Kommentare)"),
+        format_func=lambda x: f"Runde {x}" + (" ← neu" if x > max_round else f" ({round_counts.get(x, 0)} Kommentare)"),
+        key="current_round",
     )
-    st.session_state["current_round"] = current_round
 
     st.markdown("---")
 
     # Sidebar stats
-    df_all = feedback_db.export_dataframe()
-    if not df_all.empty:
-        open_count = len(df_all[df_all["status"] == "open"])
-        resolved_count = len(df_all[df_all["status"] == "resolved"])
+    counts = feedback_db.get_counts()
+    if counts.total:
+        open_count = counts.by_status.get("open", 0)
+        resolved_count = counts.by_status.get("resolved", 0)
         st.markdown(f"""
         <div style="background:#ffffff; border:1px solid #e2e5ea; border-radius:8px; padding:12px; font-size:12px;">
             <div style="font-weight:600; color:#1a202c; margin-bottom:6px;">📊 Status</div>
             <div style="display:flex; justify-content:space-between; margin-bottom:4px;">
                 <span style="color:#6b7280">Gesamt:</span>
-                <span style="font-weight:600; font-family:'JetBrains Mono',mono">{len(df_all)}</span>
+                <span style="font-weight:600; font-family:'JetBrains Mono',mono">{counts.total}</span>
             </div>
             <div style="display:flex; justify-content:space-between; margin-bottom:4px;">
                 <span style="color:#6b7280">🔲 Offen:</span>
@@ -96,18 +167,6 @@ with st.sidebar:
         """, unsafe_allow_html=True)
 
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
-    st.caption("Feedback in Google Sheet · Sichtbar für alle Nutzer")
-
-# ── Page Navigation ───────────────────────────────────────────
-exec_page = st.Page(exec_show, title="Executive Summary", icon="📊", url_path="exec", default=True)
-uptake_page = st.Page(uptake_show, title="Markt-Uptake", icon="📈", url_path="uptake")
-regional_page = st.Page(regional_show, title="Regionale Performance", icon="🗺", url_path="regional")
-feedback_page = st.Page(feedback_show, title="Feedback-Übersicht", icon="💬", url_path="feedback")
+    st.caption(get_backend().caption)
 
-nav = st.navigation(
-    {
-        "Dashboard": [exec_page, uptake_page, regional_page],
-        "Admin": [feedback_page],
-    }
-)
-nav.run()
+perf.recorder().add("app.full_run", (time.perf_counter() - _run_started) * 1000)
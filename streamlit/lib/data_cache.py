@@ -0,0 +1,104 @@
+"""
+Columnar on-disk cache for the dashboard data.
+
+The source is either a JSON file shaped like ``shared/mock-data.json`` or
+a directory of CSV drops (``monthly.csv``, ``regions.csv``,
+``competitors.csv`` + ``kpis.json``).  Parsing it is slow for large
+drops, so each table is written once as an uncompressed Feather (Arrow
+IPC) file keyed by the source's mtime/size, and later starts
+memory-map those files instead of parsing again.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from lib import perf
+
+log = logging.getLogger(__name__)
+
+TABLES = ("monthly", "regions", "competitors")
+
+
+def source_files(source: Path) -> list:
+    """Files that make up ``source`` (the JSON file, or the CSV drop files)."""
+    if source.is_dir():
+        return sorted(p for p in source.iterdir() if p.suffix in (".csv", ".json"))
+    return [source]
+
+
+def source_version(source: Path) -> str:
+    """Short key that changes whenever a source file's mtime or size changes."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in source_files(source):
+        st = path.stat()
+        h.update(f"{path.name}:{st.st_mtime_ns}:{st.st_size};".encode())
+    return h.hexdigest()
+
+
+def load(source: Path, version: str, cache_dir: Path) -> dict:
+    """Return ``{"monthly": df, "regions": df, "competitors": df, "kpis": dict}``."""
+    paths = {name: cache_dir / f"{name}-{version}.feather" for name in TABLES}
+    kpis_path = cache_dir / f"kpis-{version}.json"
+    perf.cache_lookup("data")
+    if kpis_path.exists() and all(p.exists() for p in paths.values()):
+        data = {name: _read_feather(p) for name, p in paths.items()}
+        data["kpis"] = json.loads(kpis_path.read_text(encoding="utf-8"))
+        return data
+
+    perf.cache_miss("data")
+    with perf.timer("data.parse"):
+        data = _read_source(source)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for name, path in paths.items():
+            _atomic_write(path, lambda tmp, df=data[name]: feather.write_feather(
+                df, tmp, compression="uncompressed"))
+        _atomic_write(kpis_path, lambda tmp: Path(tmp).write_text(
+            json.dumps(data["kpis"]), encoding="utf-8"))
+        _prune(cache_dir, keep=version)
+    except OSError:
+        # Read-only deployments simply run without the cache
+        log.warning("Could not write data cache to %s", cache_dir, exc_info=True)
+    return data
+
+
+def _read_source(source: Path) -> dict:
+    if source.is_dir():
+        data = {name: pd.read_csv(source / f"{name}.csv", engine="pyarrow") for name in TABLES}
+        data["kpis"] = json.loads((source / "kpis.json").read_text(encoding="utf-8"))
+        return data
+    with open(source, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    data = {name: pd.DataFrame(raw[name]) for name in TABLES}
+    data["kpis"] = raw["kpis"]
+    return data
+
+
+def _read_feather(path: Path) -> pd.DataFrame:
+    # Memory-mapped and uncompressed: numeric columns are not copied on read
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+
+def _atomic_write(path: Path, write):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _prune(cache_dir: Path, keep: str):
+    """Remove cache files of older source versions."""
+    for path in cache_dir.iterdir():
+        if path.suffix in (".feather", ".json") and not path.stem.endswith(f"-{keep}"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,295 @@
+"""
+Storage backends behind the feedback_db API.
+
+Each backend stores rows in the column order of the Google Sheet and
+exposes the same small interface:
+
+  - load_records()              → list of dicts (one per row, COLUMNS keys)
+  - load_rows(start)            → records from data row ``start`` (0-based) on
+  - load_statuses()             → (id, status) of every data row, in row order
+  - append_rows(rows)           → append rows (lists in COLUMNS order)
+  - set_statuses({id: status})  → number of rows updated (one call)
+  - existing_ids(ids)           → the given ids that are stored (idempotent replays)
+  - is_permanent(error)         → True if retrying the failed write cannot succeed
+  - take_reordered()            → True once after a write found rows moved in the table
+
+Backends:
+  - "sheets": Google Sheet via gspread (shared with the React variant)
+  - "sqlite": local SQLite file in WAL mode (fast, single host)
+
+The backend is chosen by the ``[feedback] backend`` setting
+(see lib/settings.py); the default stays "sheets".
+"""
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from lib import perf, settings
+
+# ── Column order in the Sheet (must match header row) ────────
+COLUMNS = ["id", "page_id", "element_id", "round", "author",
+           "comment", "rating", "status", "created_at", "source"]
+
+DEFAULT_SQLITE_PATH = Path(__file__).parent.parent / "feedback.db"
+
+
+# ── Google Sheets ────────────────────────────────────────────
+
+def _row_to_record(row: list) -> dict:
+    """Map a raw sheet row (trailing empty cells omitted) to a record."""
+    row = list(row) + [""] * (len(COLUMNS) - len(row))
+    return dict(zip(COLUMNS, row))
+
+
+class SheetsBackend:
+    """Feedback rows in the shared Google Sheet.
+
+    Keeps an id → sheet-row index, built whenever rows are loaded and
+    extended on append, so status updates need no id-column scan; the
+    target rows' id cells are checked before writing, and the index is
+    rebuilt if the sheet was reordered.
+    """
+
+    name = "sheets"
+    caption = "Feedback in Google Sheet · Sichtbar für alle Nutzer"
+
+    def __init__(self, client):
+        self.client = client
+        self._lock = threading.Lock()
+        self._row_of = {}  # feedback id → sheet row number (1-based)
+        self._reordered = False  # set_statuses found rows moved since the last load
+
+    def load_records(self) -> list:
+        ws = self.client.worksheet()
+        records = self.client.call(ws.get_all_records, expected_headers=COLUMNS)
+        with self._lock:
+            self._row_of = {str(r["id"]): i + 2 for i, r in enumerate(records)}
+        return records
+
+    def load_rows(self, start: int) -> list:
+        # Data row 0 is sheet row 2 (row 1 = header)
+        ws = self.client.worksheet()
+        values = self.client.call(ws.get, f"A{start + 2}:J")
+        records = [_row_to_record(row) for row in values]
+        with self._lock:
+            for i, r in enumerate(records):
+                self._row_of[str(r["id"])] = start + i + 2
+        return records
+
+    def load_statuses(self) -> list:
+        ws = self.client.worksheet()
+        # Ids with the statuses, so callers can tell if rows were reordered
+        id_cells, status_cells = self.client.call(ws.batch_get, ["A2:A", "H2:H"])  # A = id, H = status
+        statuses = [row[0] if row else "" for row in status_cells]
+        statuses += [""] * (len(id_cells) - len(statuses))
+        return [(str(row[0]) if row else "", s) for row, s in zip(id_cells, statuses)]
+
+    def append_rows(self, rows: list):
+        ws = self.client.worksheet()
+        response = self.client.call(ws.append_rows, rows, value_input_option="USER_ENTERED")
+        # e.g. "feedback!A12:J14" → first appended row is 12
+        updated = response.get("updates", {}).get("updatedRange", "")
+        match = re.search(r"![A-Z]+(\d+)", updated)
+        if match:
+            first = int(match.group(1))
+            with self._lock:
+                for i, row in enumerate(rows):
+                    self._row_of[str(row[0])] = first + i
+
+    def set_statuses(self, changes: dict) -> int:
+        ws = self.client.worksheet()
+        with self._lock:
+            missing = [i for i in changes if i not in self._row_of]
+        if missing:
+            # Unknown ids (e.g. written by React since the last sync): rebuild
+            # the index from column A once instead of failing.
+            self._rebuild_index(ws)
+        else:
+            # Rows may have moved (sorted or deleted in the sheet): check the
+            # id cells of the target rows in one call before writing
+            cells = self._cells(changes)
+            id_cells = self.client.call(ws.batch_get, [f"A{r}" for r, _, _ in cells])
+            found = [str(v[0][0]) if v and v[0] else "" for v in id_cells]
+            if found != [i for _, i, _ in cells]:
+                perf.count("sheets.row_index_rebuilds")
+                self._rebuild_index(ws)
+                with self._lock:
+                    self._reordered = True
+        cells = self._cells(changes)
+        if not cells:
+            return 0
+        self.client.call(
+            ws.batch_update,
+            [{"range": f"H{r}", "values": [[s]]} for r, _, s in cells],  # column H = status
+            value_input_option="USER_ENTERED",
+        )
+        return len(cells)
+
+    def existing_ids(self, ids: list) -> set:
+        self._rebuild_index(self.client.worksheet())
+        with self._lock:
+            return {str(i) for i in ids} & self._row_of.keys()
+
+    def take_reordered(self) -> bool:
+        """Whether rows moved since the last check (the snapshot must reload)."""
+        with self._lock:
+            reordered, self._reordered = self._reordered, False
+            return reordered
+
+    def _rebuild_index(self, ws):
+        id_cells = self.client.call(ws.col_values, 1)  # column A = id
+        with self._lock:
+            self._row_of = {str(v): i + 1 for i, v in enumerate(id_cells) if i > 0}
+
+    def _cells(self, changes: dict) -> list:
+        """(sheet row, id, status) for the ids in the index."""
+        with self._lock:
+            return [(self._row_of[i], i, s) for i, s in changes.items() if i in self._row_of]
+
+    def is_permanent(self, error: Exception) -> bool:
+        # 400 = the sheet rejects the data itself; quota, 5xx and network
+        # errors pass, and 401/403/404 are settings problems worth waiting out
+        from lib.sheets_client import status_of
+        return isinstance(error, (TypeError, ValueError)) or status_of(error) == 400
+
+
+# ── SQLite (WAL) ─────────────────────────────────────────────
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    id          TEXT PRIMARY KEY,
+    page_id     TEXT NOT NULL,
+    element_id  TEXT,
+    round       INTEGER NOT NULL,
+    author      TEXT,
+    comment     TEXT,
+    rating      INTEGER,
+    status      TEXT NOT NULL DEFAULT 'open',
+    created_at  TEXT NOT NULL,
+    source      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_page_id    ON feedback(page_id);
+CREATE INDEX IF NOT EXISTS idx_feedback_element_id ON feedback(element_id);
+CREATE INDEX IF NOT EXISTS idx_feedback_round      ON feedback(round);
+CREATE INDEX IF NOT EXISTS idx_feedback_status     ON feedback(status);
+"""
+
+
+class SQLiteBackend:
+    """Feedback rows in a local SQLite file (WAL journal).
+
+    One connection is shared by all sessions of the process; writes are
+    serialised with a lock, readers never block writers thanks to WAL.
+    """
+
+    name = "sqlite"
+    caption = "Feedback in lokaler SQLite-Datenbank · Nur dieser Server"
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def load_records(self) -> list:
+        return self.load_rows(0)
+
+    @perf.timed("sqlite.load_rows", size=perf.approx_bytes)
+    def load_rows(self, start: int) -> list:
+        with self._lock:
+            cur = self._conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM feedback "
+                "ORDER BY rowid LIMIT -1 OFFSET ?", (start,),
+            )
+            return [dict(r) for r in cur.fetchall()]
+
+    @perf.timed("sqlite.load_statuses", size=perf.approx_bytes)
+    def load_statuses(self) -> list:
+        with self._lock:
+            cur = self._conn.execute("SELECT id, status FROM feedback ORDER BY rowid")
+            return [tuple(r) for r in cur.fetchall()]
+
+    @perf.timed("sqlite.append_rows")
+    def append_rows(self, rows: list):
+        values = [list(row) for row in rows]
+        for v in values:
+            v[2] = v[2] or None  # empty element_id → NULL
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO feedback ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                values,
+            )
+
+    @perf.timed("sqlite.set_statuses")
+    def set_statuses(self, changes: dict) -> int:
+        with self._lock, self._conn:
+            cur = self._conn.executemany(
+                "UPDATE feedback SET status = ? WHERE id = ?",
+                [(s, i) for i, s in changes.items()],
+            )
+            return cur.rowcount
+
+    def existing_ids(self, ids: list) -> set:
+        ids = [str(i) for i in ids]
+        found = set()
+        with self._lock:
+            for start in range(0, len(ids), 500):  # stay below the SQL variable limit
+                chunk = ids[start:start + 500]
+                cur = self._conn.execute(
+                    f"SELECT id FROM feedback WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+                found.update(r[0] for r in cur.fetchall())
+        return found
+
+    def take_reordered(self) -> bool:
+        return False  # rows keep their rowid order
+
+    def is_permanent(self, error: Exception) -> bool:
+        # Constraint violations and unbindable values fail the same way on
+        # every retry; OperationalError (locked, disk full) may pass
+        return isinstance(error, (sqlite3.IntegrityError, sqlite3.DataError,
+                                  sqlite3.InterfaceError, TypeError, ValueError))
+
+
+# ── Selection ────────────────────────────────────────────────
+
+@st.cache_resource(show_spinner=False)
+def _get_client():
+    """Authenticate once and cache the quota-aware Sheets client."""
+    # Imported here so gspread/google-auth load only when Sheets is used
+    from lib.sheets_client import SheetsClient
+    return SheetsClient(
+        st.secrets["gcp_service_account"],
+        st.secrets["google_sheets"]["spreadsheet_url"],
+        requests_per_minute=settings.get("feedback", "sheets_requests_per_minute", 60),
+        max_retries=settings.get("feedback", "sheets_max_retries", 5),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _create_backend(name: str, sqlite_path: str):
+    if name == "sqlite":
+        return SQLiteBackend(sqlite_path)
+    if name == "sheets":
+        return SheetsBackend(_get_client())
+    raise ValueError(f"Unknown feedback backend: {name!r} (expected 'sheets' or 'sqlite')")
+
+
+def get_backend():
+    """Return the configured backend (one instance per process)."""
+    name = settings.get("feedback", "backend", "sheets")
+    sqlite_path = settings.get("feedback", "sqlite_path", str(DEFAULT_SQLITE_PATH))
+    return _create_backend(name, sqlite_path)
+
+
+def sheets_quota():
+    """Sheets API usage of this process (see SheetsClient.quota), None for SQLite."""
+    backend = get_backend()
+    return backend.client.quota() if backend.name == "sheets" else None
@@ -1,93 +1,540 @@
 """
-Google Sheets-based feedback persistence for the Streamlit variant.
-Replaces the previous SQLite backend. Same API surface — all callers
+Feedback persistence for the Streamlit variant.
+Same API surface as the original SQLite version — all callers
 (feedback_ui.py, pages/, app.py) remain unchanged.
 
-Requires:
-  - gspread + google-auth
-  - st.secrets["gcp_service_account"] with service account JSON
-  - st.secrets["google_sheets"]["spreadsheet_url"]
+Storage is pluggable (see lib/feedback_backends.py):
+  - "sheets" (default): Google Sheet via gspread, shared with React
+  - "sqlite": local SQLite file in WAL mode
+
+Select with ``[feedback] backend = "sqlite"`` in st.secrets or the
+``FEEDBACK_BACKEND`` environment variable.
+
+With ``[feedback] shared_cache = true`` several app processes share one
+synced snapshot through lib/shared_cache.py (see _SharedSnapshotStore).
 """
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
 import streamlit as st
-import gspread
-from google.oauth2.service_account import Credentials
-from datetime import datetime
 import pandas as pd
 
-# ── Column order in the Sheet (must match header row) ────────
-COLUMNS = ["id", "page_id", "element_id", "round", "author",
-           "comment", "rating", "status", "created_at", "source"]
+from lib import feedback_ids, perf, settings
+from lib.feedback_backends import COLUMNS, get_backend
+from lib.feedback_journal import Journal
+from lib.feedback_index import (FeedbackCounts, FilterIndex, IdIndex, PageFeedback, as_datetime64,
+                                build_counts, build_page_feedback)
+from lib.feedback_queue import WriteBehindQueue
+from lib.feedback_search import SearchIndex
+from lib.shared_cache import SharedCache
+
+log = logging.getLogger(__name__)
+
+_SHARED_CACHE_PATH = Path(__file__).parent.parent / ".cache" / "feedback-shared.db"
+_JOURNAL_DIR = Path(__file__).parent.parent / ".cache" / "journal"
+
+
+# Low-cardinality text columns are stored as categoricals
+CATEGORY_COLUMNS = ["page_id", "element_id", "status", "source"]
+
+
+def _to_frame(records: list) -> pd.DataFrame:
+    """Build a compact, typed DataFrame from backend records.
+
+    round/rating → int8, created_at → datetime64 (naive UTC),
+    page_id/element_id/status/source → category.
+    """
+    df = pd.DataFrame(records, columns=COLUMNS)
+    df["id"] = df["id"].astype(str)
+    df["round"] = pd.to_numeric(df["round"], errors="coerce").fillna(1).clip(1, 127).astype("int8")
+    df["rating"] = pd.to_numeric(df["rating"], errors="coerce").fillna(3).clip(1, 5).astype("int8")
+    df["created_at"] = _parse_timestamps(df["created_at"])
+    # Treat empty strings as None for element_id
+    df["element_id"] = df["element_id"].replace("", None)
+    return _categorize(df)
+
+
+def _parse_timestamps(values: pd.Series) -> pd.Series:
+    """Parse ISO timestamps; naive ones (Python) are taken as UTC like React's "...Z"."""
+    ts = pd.to_datetime(values, errors="coerce", utc=True, format="ISO8601")
+    unparsed = ts.isna() & values.notna() & (values.astype(str) != "")
+    if unparsed.any():
+        # Sheets may hand back locale-formatted dates
+        ts[unparsed] = pd.to_datetime(values[unparsed], errors="coerce", utc=True, format="mixed")
+    return ts.dt.tz_convert(None)
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """(Re)apply categorical dtypes, e.g. after concat or a status update."""
+    return df.astype({c: "category" for c in CATEGORY_COLUMNS})
+
+
+def _sort_newest_first(df: pd.DataFrame) -> pd.DataFrame:
+    if df["created_at"].is_monotonic_increasing:
+        # Rows arrive in append (= creation) order: reversing is enough
+        return df.iloc[::-1].reset_index(drop=True)
+    return df.sort_values("created_at", ascending=False, kind="stable",
+                          na_position="last", ignore_index=True)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable view of all feedback rows at one point in time.
+
+    ``df`` is shared by every session — treat it as read-only.  It is
+    sorted by created_at, newest first.
+    Indexes built from it are memoized per snapshot via ``derived()``.
+    """
+    version: int
+    df: pd.DataFrame
+    _derived: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def derived(self, key: str, build):
+        """Return ``build(df)``, computed once for this snapshot."""
+        perf.cache_lookup("derived")
+        try:
+            return self._derived[key]
+        except KeyError:
+            perf.cache_miss("derived")
+            with perf.timer(f"feedback.build_{key}"):
+                value = self._derived[key] = build(self.df)
+            return value
+
+
+class _SnapshotStore:
+    """Process-wide holder of the current snapshot.
+
+    All browser sessions read the same snapshot.  It is refreshed from the
+    backend when older than the TTL or after any write (from any session).
+    A lock makes sure only one session refreshes at a time.
+
+    In "delta" sync mode a refresh only fetches rows appended since the
+    last sync plus the id and status columns (the sheet is append-only
+    apart from status).  A full reload still runs every ``full_sync_interval``
+    seconds and whenever rows disappear or move (ids no longer line up), to
+    pick up manual edits in the sheet.
+
+    New rows and status changes are added to the snapshot right away
+    (``add_local`` / ``set_local_statuses``) and kept as a local overlay
+    until a sync after their write returns them from the backend.
+
+    ``prefetch`` runs an expired refresh on a background thread, so a page
+    can draw its charts while the backend round trip is in flight.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._sync_lock = threading.Lock()   # held during backend refresh
+        self._state_lock = threading.Lock()  # guards snapshot/base/local swaps
+        self._snapshot = None
+        self._stale = True
+        self._base = None          # rows in backend order, as last synced
+        self._local = {}           # id → record, written here but not yet synced
+        self._statuses = {}        # id → status, changed here but not yet synced
+        self._statuses_acked = {}  # subset of _statuses already written to the backend
+        self._synced_at = 0.0
+        self._last_full_sync = 0.0
+        self._reloaded = False     # set by a sync that replaced (not extended) the rows
+        self._retry_at = 0.0       # after a failed refresh, wait before the next try
+        self._queue = None
+        self._prefetcher = None
+        self._prefetch = None      # Future of the running background refresh
+
+    def get(self, ttl: float) -> Snapshot:
+        perf.cache_lookup("snapshot")
+        snap = self._snapshot
+        if not self._is_expired(snap, ttl):
+            return snap
+        with self._sync_lock, perf.timer("feedback.refresh"):
+            if self._is_expired(self._snapshot, ttl):
+                perf.cache_miss("snapshot")
+                # Clear the flag first: a write during the load marks it again
+                self._stale = False
+                self._reloaded = False
+                with self._state_lock:
+                    # Written before this sync started, so the sync will see them
+                    confirmed = dict(self._statuses_acked)
+                try:
+                    base = self._sync()
+                except Exception:
+                    self._stale = True
+                    if self._snapshot is None:
+                        raise
+                    # Keep serving the last snapshot; try again after a TTL
+                    log.warning("Feedback refresh failed, serving version %d",
+                                self._snapshot.version, exc_info=True)
+                    self._retry_at = time.monotonic() + ttl
+                    return self._snapshot
+                if base is None:
+                    # Nothing changed: keep the version and every index derived from it
+                    self._synced_at = time.monotonic()
+                    return self._snapshot
+                with self._state_lock:
+                    self._base = base
+                    self._synced_at = time.monotonic()
+                    synced_ids = set(base["id"])
+                    self._local = {k: v for k, v in self._local.items() if k not in synced_ids}
+                    for i, status in confirmed.items():
+                        if self._statuses.get(i) == status:
+                            del self._statuses[i]
+                        if self._statuses_acked.get(i) == status:
+                            del self._statuses_acked[i]
+                    # After a full reload rows may have been edited: rebuild indexes
+                    self._publish(carry=not self._reloaded)
+            return self._snapshot
+
+    def invalidate(self):
+        self._stale = True
+
+    def prefetch(self, ttl: float) -> Future:
+        """Start ``get(ttl)`` in the background if the snapshot is expired.
+
+        Returns a Future of the snapshot (already done when it is fresh).
+        Concurrent callers share the running refresh.
+        """
+        with self._state_lock:
+            if self._prefetch is not None and not self._prefetch.done():
+                return self._prefetch
+            if not self._is_expired(self._snapshot, ttl):
+                done = Future()
+                done.set_result(self._snapshot)
+                return done
+            if self._prefetcher is None:
+                self._prefetcher = ThreadPoolExecutor(1, thread_name_prefix="feedback-prefetch")
+            self._prefetch = self._prefetcher.submit(self.get, ttl)
+            return self._prefetch
+
+    def add_local(self, row: list):
+        """Show a freshly written row in the snapshot before the next sync."""
+        record = dict(zip(COLUMNS, row))
+        with self._state_lock:
+            self._local[record["id"]] = record
+            if self._base is not None:
+                self._publish(added=record)
+
+    def set_local_statuses(self, changes: dict):
+        """Show status changes in the snapshot before they reach the backend."""
+        with self._state_lock:
+            self._statuses.update(changes)
+            if self._base is not None:
+                self._publish()
+
+    def queue(self) -> WriteBehindQueue:
+        """Write-behind queue for writes (started on first use).
+
+        Items are {"op": "append", "row": [...]} or {"op": "status",
+        "changes": {id: status}}.  With the journal enabled they are on
+        local disk before ``put`` returns, and writes a previous process
+        left unacknowledged are replayed (and shown) right away.
+        """
+        with self._state_lock:
+            if self._queue is None:
+                journal = None
+                if settings.get("feedback", "journal", True):
+                    directory = settings.get("feedback", "journal_dir", str(_JOURNAL_DIR))
+                    journal = Journal(directory, name=self._backend.name)
+                self._queue = WriteBehindQueue(
+                    perf.timed("feedback.flush")(self._apply),
+                    on_flushed=self._on_flushed,
+                    interval=settings.get("feedback", "flush_interval", 1.0),
+                    max_batch=settings.get("feedback", "max_batch", 100),
+                    journal=journal,
+                    is_permanent=self._backend.is_permanent,
+                    on_rejected=self._on_rejected,
+                )
+                for item in self._queue.pending():
+                    if item["op"] == "append":
+                        record = dict(zip(COLUMNS, item["row"]))
+                        self._local[record["id"]] = record
+                    else:
+                        self._statuses.update(item["changes"])
+                if self._base is not None and self._queue.pending():
+                    self._publish()
+            return self._queue
+
+    def _apply(self, batch: list, retry: bool):
+        """Write one queue batch: appends first, then status changes (in order)."""
+        rows = [item["row"] for item in batch if item["op"] == "append"]
+        if rows and retry:
+            # An earlier attempt (or process) may have written some rows already
+            written = self._backend.existing_ids([row[0] for row in rows])
+            rows = [row for row in rows if str(row[0]) not in written]
+        if rows:
+            self._backend.append_rows(rows)
+        changes = {}
+        for item in batch:
+            if item["op"] == "status":
+                changes.update(item["changes"])
+        if changes:
+            self._backend.set_statuses(changes)
+
+    def _on_flushed(self, batch: list):
+        perf.count("feedback.rows_flushed", sum(item["op"] == "append" for item in batch))
+        with self._state_lock:
+            for item in batch:
+                if item["op"] == "status":
+                    for i, status in item["changes"].items():
+                        if self._statuses.get(i) == status:
+                            self._statuses_acked[i] = status
+        self.invalidate()
+
+    def _on_rejected(self, item: dict, error: Exception):
+        """Drop the overlay of a write the backend refused (kept in the journal)."""
+        perf.count("feedback.rejected")
+        with self._state_lock:
+            if item["op"] == "append":
+                self._local.pop(item["row"][0], None)
+            else:
+                for i, status in item["changes"].items():
+                    if self._statuses.get(i) == status:
+                        del self._statuses[i]
+                        self._statuses_acked.pop(i, None)
+            if self._base is not None:
+                self._publish(carry=False)
+
+    def _publish(self, carry: bool = True, added: dict = None):
+        """Swap in a new snapshot built from base + local overlay (state lock held).
+
+        With ``carry`` the search index of the previous snapshot is kept and
+        extended by the new rows (``added``, or whatever it has not seen yet)
+        instead of being rebuilt.
+        """
+        df = self._base
+        if self._local:
+            overlay = _to_frame(list(self._local.values()))
+            df = overlay if df.empty else _categorize(pd.concat([df, overlay], ignore_index=True))
+        if self._statuses:
+            changed = df["id"].isin(self._statuses.keys())
+            if changed.any():
+                status = df["status"].astype(object)
+                status[changed] = df.loc[changed, "id"].map(self._statuses)
+                df = _categorize(df.assign(status=status))
+        # Sorted once per snapshot, so readers never re-sort
+        df = _sort_newest_first(df)
+        previous = self._snapshot
+        version = previous.version + 1 if previous else 1
+        self._snapshot = Snapshot(version, df)
+
+        index = previous._derived.get("search") if carry and previous else None
+        if index is not None:
+            if added is not None:
+                index.add(added["id"], added["comment"], added["author"])
+            else:
+                index.add_missing(df)
+            self._snapshot._derived["search"] = index
+
+    def _is_expired(self, snap, ttl: float) -> bool:
+        if snap is None:
+            return True
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+        return self._stale or now - self._synced_at >= ttl
+
+    def _sync(self):
+        """Return the rows in backend order, or None if they are unchanged."""
+        delta = (
+            settings.get("feedback", "sync_mode", "delta") == "delta"
+            and self._base is not None
+            and time.monotonic() - self._last_full_sync
+            < settings.get("feedback", "full_sync_interval", 600.0)
+        )
+        return self._delta_sync(self._base) if delta else self._full_sync()
+
+    @perf.timed("feedback.full_sync")
+    def _full_sync(self) -> pd.DataFrame:
+        self._last_full_sync = time.monotonic()
+        self._reloaded = True
+        return _to_frame(self._backend.load_records())
+
+    @perf.timed("feedback.delta_sync")
+    def _delta_sync(self, base: pd.DataFrame):
+        """``base`` plus rows appended since, with current statuses (None if unchanged)."""
+        if self._backend.take_reordered():
+            # A status write found the rows moved; positions in base are stale
+            return self._full_sync()
+        new = _to_frame(self._backend.load_rows(len(base)))
+        rows = self._backend.load_statuses()
+        changed = not new.empty
+        if changed:
+            base = new if base.empty else _categorize(pd.concat([base, new], ignore_index=True))
+        if len(rows) < len(base) or [i for i, _ in rows[:len(base)]] != base["id"].tolist():
+            # Rows were deleted or moved in the sheet — start over
+            return self._full_sync()
+        statuses = [s for _, s in rows[:len(base)]]
+        if base["status"].tolist() != statuses:
+            base = _categorize(base.assign(status=statuses))
+            changed = True
+        return base if changed else None
+
+
+class _SharedSnapshotStore(_SnapshotStore):
+    """Snapshot store whose synced rows live in a cross-process SharedCache.
+
+    Every ``shared_poll_interval`` seconds (or right after a local write)
+    the process checks the cache version and loads the table when another
+    process has published a newer one.  If the table is older than the TTL
+    or a write marked it dirty, whichever process gets the lease refreshes
+    it from the backend (delta or full, as in the base class) and
+    publishes it.  Local writes still show up immediately via ``add_local``;
+    other processes see them once flushed, after at most
+    flush_interval + 2 × shared_poll_interval + one sync.
+    """
 
-SCOPES = [
-    "https://www.googleapis.com/auth/spreadsheets",
-    "https://www.googleapis.com/auth/drive",
-]
+    def __init__(self, backend, cache: SharedCache):
+        super().__init__(backend)
+        self._cache = cache
+        self._cache_version = 0     # version of the shared table our _base came from
+        self._cache_full_sync = 0.0  # its full_synced_at (a change means rows were replaced)
+        self._checked_at = 0.0
+        self._ttl = 30.0
+
+    def get(self, ttl: float) -> Snapshot:
+        self._ttl = ttl
+        return super().get(ttl)
+
+    def invalidate(self):
+        super().invalidate()
+        self._cache.mark_dirty()
+
+    def _is_expired(self, snap, ttl: float) -> bool:
+        if snap is None:
+            return True
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+        poll = settings.get("feedback", "shared_poll_interval", 2.0)
+        return self._stale or now - self._checked_at >= poll
+
+    def _sync(self):
+        self._checked_at = time.monotonic()
+        state = self._cache.state()
+        if self._needs_refresh(state) and self._cache.try_lease():
+            try:
+                # Another process may have refreshed while we asked for the lease
+                state = self._cache.state()
+                if self._needs_refresh(state):
+                    return self._refresh(state)
+            finally:
+                self._cache.release_lease()
+        if state.version != self._cache_version or self._base is None:
+            base = self._load_shared()
+            if base is not None:
+                return base
+            if self._base is None:
+                # First start while another process holds the lease: load ourselves
+                return self._full_sync()
+        return None
+
+    def _needs_refresh(self, state) -> bool:
+        return state.version == 0 or state.dirty or time.time() - state.synced_at >= self._ttl
+
+    def _refresh(self, state):
+        current = state.version == self._cache_version and self._base is not None
+        base = self._base if current else self._load_shared()
+        delta = (
+            settings.get("feedback", "sync_mode", "delta") == "delta"
+            and base is not None
+            and time.time() - state.full_synced_at
+            < settings.get("feedback", "full_sync_interval", 600.0)
+        )
+        loaded, self._reloaded = self._reloaded, False
+        synced = self._delta_sync(base) if delta else self._full_sync()
+        if synced is None:
+            # Unchanged: mark the shared table fresh without a new version
+            self._cache.touch(state.dirty_seq)
+            self._reloaded = loaded
+            return None if current else base
+        base = synced
+        full = self._reloaded
+        with perf.timer("feedback.shared_publish"):
+            self._cache_version = self._cache.publish(base, state.dirty_seq, full=full)
+        if full:
+            self._cache_full_sync = self._cache.state().full_synced_at
+        self._reloaded = loaded or full
+        return base
+
+    @perf.timed("feedback.shared_load")
+    def _load_shared(self):
+        version, full_synced_at, df = self._cache.load()
+        if df is None:
+            return None
+        if full_synced_at != self._cache_full_sync:
+            self._reloaded = True
+        self._cache_version, self._cache_full_sync = version, full_synced_at
+        return _categorize(df)
 
 
 @st.cache_resource(show_spinner=False)
-def _get_client():
-    """Authenticate once and cache the gspread client."""
-    creds = Credentials.from_service_account_info(
-        st.secrets["gcp_service_account"], scopes=SCOPES,
-    )
-    return gspread.authorize(creds)
-
-
-def _sheet():
-    """Return the 'feedback' worksheet (tab)."""
-    client = _get_client()
-    url = st.secrets["google_sheets"]["spreadsheet_url"]
-    spreadsheet = client.open_by_url(url)
-    return spreadsheet.worksheet("feedback")
-
-
-def _next_id() -> str:
-    """Generate a short unique ID (matching React's nextId pattern)."""
-    import time, random, string
-    t = int(time.time() * 1000)
-    base36 = ""
-    while t > 0:
-        base36 = string.digits + string.ascii_lowercase[: 26][t % 36] if False else ""
-        break
-    # Simple approach: timestamp hex + random suffix
-    return f"{int(time.time()):x}{random.randint(1000, 9999)}"
-
-
-def _load_all() -> pd.DataFrame:
-    """Load all rows from the sheet into a DataFrame.
-
-    Uses session_state cache to avoid repeated API calls within a single
-    Streamlit rerun. Cache is invalidated on write operations.
+def _create_store(backend_key: str, shared_path: str, _backend) -> _SnapshotStore:
+    if shared_path:
+        store = _SharedSnapshotStore(_backend, SharedCache(shared_path, name=_backend.name))
+    else:
+        store = _SnapshotStore(_backend)
+    if settings.get("feedback", "write_behind", True):
+        store.queue()  # replays journal entries left by a previous process
+    return store
+
+
+def _store() -> _SnapshotStore:
+    backend = get_backend()
+    shared_path = ""
+    if settings.get("feedback", "shared_cache", False):
+        shared_path = settings.get("feedback", "shared_cache_path", str(_SHARED_CACHE_PATH))
+    return _create_store(f"{backend.name}:{id(backend)}", shared_path, backend)
+
+
+def get_snapshot() -> Snapshot:
+    """Return the current shared snapshot (reloaded after the TTL or a write)."""
+    return _store().get(settings.get("feedback", "cache_ttl", 30.0))
+
+
+def prefetch() -> Future:
+    """Start loading the snapshot in the background (call at script start).
+
+    Readers need no changes: ``get_snapshot`` simply waits for a refresh
+    that is still running.
     """
-    if "_feedback_cache" not in st.session_state:
-        ws = _sheet()
-        records = ws.get_all_records(expected_headers=COLUMNS)
-        df = pd.DataFrame(records)
-        if df.empty:
-            df = pd.DataFrame(columns=COLUMNS)
-        else:
-            # Type coercion
-            df["round"] = pd.to_numeric(df["round"], errors="coerce").fillna(1).astype(int)
-            df["rating"] = pd.to_numeric(df["rating"], errors="coerce").fillna(3).astype(int)
-            df["id"] = df["id"].astype(str)
-            # Treat empty strings as None for element_id
-            df["element_id"] = df["element_id"].replace("", None)
-        st.session_state["_feedback_cache"] = df
-    return st.session_state["_feedback_cache"]
+    return _store().prefetch(settings.get("feedback", "cache_ttl", 30.0))
+
+
+def data_version() -> int:
+    """Version of the current snapshot; changes whenever the data changes."""
+    return get_snapshot().version
+
+
+def pending_writes() -> int:
+    """Writes of this process that are queued but not yet in the backend."""
+    if not settings.get("feedback", "write_behind", True):
+        return 0
+    return len(_store().queue().pending())
 
 
 def _invalidate_cache():
-    """Clear cached data so next read fetches fresh from the sheet."""
-    st.session_state.pop("_feedback_cache", None)
+    """Mark the shared snapshot stale for every session."""
+    _store().invalidate()
 
 
 # ── Public API (same signatures as the old SQLite version) ───
 
 
+@perf.timed("feedback.add_feedback")
 def add_feedback(page_id: str, round_num: int, author: str, comment: str,
                  rating: int, element_id: str = None):
-    """Insert a new feedback entry into the Google Sheet."""
-    row_id = _next_id()
+    """Insert a new feedback entry.
+
+    The row shows up in the shared snapshot immediately; with write-behind
+    enabled (default) it is appended to the backend by a background flusher.
+    """
+    row_id, ms = feedback_ids.next_id()
+    # Same instant as the id, in React's format ("...T12:34:56.789Z")
+    created_at = datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat(timespec="milliseconds")
     row = [
         row_id,
         page_id,
@@ -97,70 +544,172 @@ def add_feedback(page_id: str, round_num: int, author: str, comment: str,
         comment,
         rating,
         "open",
-        datetime.now().isoformat(),
+        created_at.replace("+00:00", "Z"),
         "streamlit",
     ]
-    ws = _sheet()
-    ws.append_row(row, value_input_option="USER_ENTERED")
-    _invalidate_cache()
+    store = _store()
+    store.add_local(row)
+    if settings.get("feedback", "write_behind", True):
+        store.queue().put({"op": "append", "row": row})
+    else:
+        get_backend().append_rows([row])
+        store.invalidate()
 
 
+@perf.timed("feedback.get_feedback")
 def get_feedback(page_id: str = None, round_num: int = None,
-                 status: str = None, element_id: str = "__unset__") -> pd.DataFrame:
-    """Retrieve feedback with optional filters, returns DataFrame."""
-    df = _load_all().copy()
-    if df.empty:
-        return df
+                 status: str = None, element_id: str = "__unset__",
+                 order: str = "newest", since=None, until=None,
+                 snapshot: Snapshot = None) -> pd.DataFrame:
+    """Retrieve feedback with optional filters, returns DataFrame.
 
+    ``element_id=None`` selects page-level comments.  ``since``/``until``
+    (naive UTC) keep rows created in [since, until).  ``order`` is
+    "newest" (created_at descending) or "export" (see export_dataframe).
+    ``snapshot`` pins the read to one snapshot (default: the current one).
+    Filters are answered from per-snapshot bitsets (feedback_index.FilterIndex),
+    time windows by binary search (feedback_index.IdIndex).
+    """
+    filters = {}
     if page_id:
-        df = df[df["page_id"] == page_id]
+        filters["page_id"] = page_id
     if element_id != "__unset__":
-        if element_id is None:
-            df = df[df["element_id"].isna()]
-        else:
-            df = df[df["element_id"] == element_id]
+        filters["element_id"] = element_id
     if round_num:
-        df = df[df["round"] == round_num]
+        filters["round"] = int(round_num)
     if status:
-        df = df[df["status"] == status]
+        filters["status"] = status
+    snapshot = snapshot or get_snapshot()
+    index = _filter_index(snapshot, order)
+    if since is None and until is None:
+        return index.select(**filters)
+    if order == "export":
+        positions = index.positions(**filters)
+        created = index.df["created_at"].to_numpy()[positions]
+        keep = ~np.isnat(created)
+        if since is not None:
+            keep &= created >= as_datetime64(since, created)
+        if until is not None:
+            keep &= created < as_datetime64(until, created)
+        positions = positions[keep]
+    else:
+        window = snapshot.derived("ids", IdIndex).window(since, until)
+        positions = np.arange(window.start, window.stop)
+        if filters:
+            # Both sorted by position: cut the window out with two binary searches
+            matching = index.positions(**filters)
+            positions = matching[np.searchsorted(matching, window.start):
+                                 np.searchsorted(matching, window.stop)]
+    return index.df.take(positions).reset_index(drop=True)
+
 
-    return df.sort_values("created_at", ascending=False).reset_index(drop=True)
+def _filter_index(snapshot: Snapshot, order: str) -> FilterIndex:
+    if order == "export":
+        # Built from this snapshot's rows: a builder must never fetch a newer snapshot
+        return snapshot.derived("export_filters", lambda _: FilterIndex(_export_frame(snapshot)))
+    return snapshot.derived("filters", FilterIndex)
+
+
+def get_page_feedback(page_id: str) -> PageFeedback:
+    """A page's feedback grouped by element_id, computed once per snapshot.
+
+    Popovers and the page history of one page all read from this instead
+    of running one filtered query each.
+    """
+    return get_snapshot().derived(f"page.{page_id}", lambda df: build_page_feedback(df, page_id))
+
+
+def get_round_start(round_num: int):
+    """Creation time (naive UTC) of the first entry of a round, or None."""
+    snapshot = get_snapshot()
+    positions = _filter_index(snapshot, "newest").positions(round=int(round_num))
+    created = snapshot.df["created_at"].to_numpy()[positions]
+    created = created[~np.isnat(created)]
+    # Newest first: the oldest dated row of the round comes last
+    return pd.Timestamp(created[-1]) if len(created) else None
+
+
+@perf.timed("feedback.search_feedback")
+def search_feedback(query: str, limit: int = None, snapshot: Snapshot = None) -> dict:
+    """Ids of entries whose comment or author match ``query`` → score, best first."""
+    return (snapshot or get_snapshot()).derived("search", SearchIndex).search(query, limit)
+
+
+def get_counts() -> FeedbackCounts:
+    """Counts per page/element/round/status, computed once per snapshot."""
+    return get_snapshot().derived("counts", build_counts)
 
 
 def get_element_count(page_id: str, element_id: str) -> int:
     """Count feedback entries for a specific element."""
-    df = _load_all()
-    if df.empty:
-        return 0
-    return len(df[(df["page_id"] == page_id) & (df["element_id"] == element_id)])
+    return get_counts().by_element.get((page_id, element_id), 0)
+
+
+def get_round_counts() -> dict:
+    """Number of feedback entries per round."""
+    return get_counts().by_round
+
+
+def get_status_counts() -> dict:
+    """Number of feedback entries per status (open/resolved)."""
+    return get_counts().by_status
+
 
+def update_status(feedback_id: str, new_status: str):
+    """Toggle feedback status (open/resolved)."""
+    update_statuses([feedback_id], new_status)
 
-def update_status(feedback_id: int, new_status: str):
-    """Toggle feedback status (open/resolved) in the Sheet."""
-    feedback_id = str(feedback_id)
-    ws = _sheet()
-    # Find the row by scanning column A (id)
-    id_cells = ws.col_values(1)  # column A = id
-    for i, cell_val in enumerate(id_cells):
-        if str(cell_val) == feedback_id:
-            ws.update_cell(i + 1, 8, new_status)  # column H = status
-            _invalidate_cache()
-            return
-    # If not found, silently return (may be stale data)
+
+def update_statuses(feedback_ids: list, new_status: str) -> int:
+    """Set the status of several entries with a single backend write.
+
+    Returns the number of rows updated; unknown ids are skipped
+    (may be stale data).
+    """
+    return set_statuses(dict.fromkeys(feedback_ids, new_status))
+
+
+@perf.timed("feedback.set_statuses")
+def set_statuses(changes: dict) -> int:
+    """Apply per-entry status changes ({id: status}) in a single backend write.
+
+    With write-behind enabled (default) the changes are journaled, shown
+    in the shared snapshot at once and written by the background flusher.
+    Returns the number of rows updated; unknown ids are skipped.
+    """
+    changes = {str(i): s for i, s in changes.items()}
+    write_behind = settings.get("feedback", "write_behind", True)
+    if write_behind:
+        ids = get_snapshot().derived("ids", IdIndex)
+        changes = {i: s for i, s in changes.items() if ids.position(i) is not None}
+    if not changes:
+        return 0
+    if write_behind:
+        store = _store()
+        store.set_local_statuses(changes)
+        store.queue().put({"op": "status", "changes": changes})
+        return len(changes)
+    updated = get_backend().set_statuses(changes)
+    if updated:
+        _invalidate_cache()
+    return updated
 
 
 def get_max_round() -> int:
-    """Return the highest round number in the Sheet."""
-    df = _load_all()
-    if df.empty:
-        return 1
-    max_r = df["round"].max()
-    return int(max_r) if pd.notna(max_r) else 1
+    """Return the highest round number in the feedback data."""
+    rounds = get_round_counts()
+    return max(rounds) if rounds else 1
 
 
+@perf.timed("feedback.export_dataframe")
 def export_dataframe() -> pd.DataFrame:
-    """Return all feedback as a DataFrame for export."""
-    df = _load_all().copy()
-    if df.empty:
-        return df
-    return df.sort_values(["round", "page_id", "created_at"]).reset_index(drop=True)
+    """Return all feedback as a DataFrame for export (shared, read-only)."""
+    return _export_frame(get_snapshot())
+
+
+def _export_frame(snapshot: Snapshot) -> pd.DataFrame:
+    return snapshot.derived("export", _sort_for_export)
+
+
+def _sort_for_export(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(["round", "page_id", "created_at"], kind="stable", ignore_index=True)
@@ -0,0 +1,80 @@
+"""
+Feedback exports (CSV, Excel, Parquet) for the admin overview.
+
+Files are generated only when a download button is clicked and cached
+per (format, filter set, data version), so repeated downloads of the
+same view — from any session — reuse the bytes until the data changes.
+Excel is written with openpyxl's write-only (streaming) workbook, which
+keeps memory flat for large exports and skips the styling pass of
+``DataFrame.to_excel``.
+"""
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from lib import perf
+
+# Format → (button label, file name, MIME type)
+FORMATS = {
+    "csv": ("📥 CSV", "feedback.csv", "text/csv"),
+    "xlsx": ("📥 Excel", "feedback.xlsx",
+             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "parquet": ("📥 Parquet", "feedback.parquet", "application/vnd.apache.parquet"),
+}
+
+
+def export_bytes(fmt: str, filters: tuple, data_version: int, df: pd.DataFrame) -> bytes:
+    """File contents of ``df`` in ``fmt``.
+
+    ``df`` is not part of the cache key: it must be fully determined by
+    ``filters`` and ``data_version``.
+    """
+    perf.cache_lookup("export")
+    return _export_bytes(fmt, filters, data_version, df)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _export_bytes(fmt: str, filters: tuple, data_version: int, _df: pd.DataFrame) -> bytes:
+    perf.cache_miss("export")
+    with perf.timer(f"export.{fmt}") as t:
+        data = _encode(fmt, _df)
+        t.bytes = len(data)
+    return data
+
+
+def _encode(fmt: str, df: pd.DataFrame) -> bytes:
+    if fmt == "csv":
+        return df.to_csv(index=False).encode("utf-8")
+    if fmt == "xlsx":
+        return _to_xlsx(df)
+    if fmt == "parquet":
+        buffer = BytesIO()
+        df.to_parquet(buffer, engine="pyarrow", index=False)
+        return buffer.getvalue()
+    raise ValueError(f"Unknown export format: {fmt!r}")
+
+
+def _to_xlsx(df: pd.DataFrame) -> bytes:
+    # Imported here so openpyxl loads only when someone exports
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("feedback")
+    header = []
+    for name in df.columns:
+        cell = WriteOnlyCell(ws, value=str(name))
+        cell.font = Font(bold=True)
+        header.append(cell)
+    ws.append(header)
+
+    # Plain Python values, NaN/NaT → empty cell
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,71 @@
+"""
+Time-sortable feedback ids, same scheme as ``nextId`` in react/src/feedbackStore.js.
+
+    lzx1k2m3 05 a7q
+    └ epoch ms ┘└┬┘└┬┘
+    (8 × base36)  │  random (3 × base36): distinguishes processes/browsers
+                  counter (2 × base36): ids created within the same ms
+
+Ids are fixed-width lower-case base36, so sorting them as strings sorts
+them by creation time (monotonic within one generator: when the counter
+of a millisecond runs out the generator borrows the next millisecond).
+Ids written by earlier versions (React: ms + 5 random chars; Python:
+hex seconds + 4 digits) do not sort by time against these; lookups by
+id still find them (feedback_index.IdIndex then sorts the ids once),
+but only ``created_at`` says when such an entry was written.
+"""
+import secrets
+import string
+import threading
+import time
+
+import streamlit as st
+
+_ALPHABET = string.digits + string.ascii_lowercase
+TIME_WIDTH, COUNTER_WIDTH, RANDOM_WIDTH = 8, 2, 3
+ID_LENGTH = TIME_WIDTH + COUNTER_WIDTH + RANDOM_WIDTH
+_MAX_COUNTER = 36 ** COUNTER_WIDTH
+
+
+def base36(value: int, width: int) -> str:
+    digits = []
+    while value:
+        value, rem = divmod(value, 36)
+        digits.append(_ALPHABET[rem])
+    return "".join(reversed(digits)).rjust(width, "0")
+
+
+class IdGenerator:
+    """Monotonic id source; one per process (see ``next_id``)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def next(self) -> tuple:
+        """Return (id, epoch ms encoded in it)."""
+        with self._lock:
+            ms = int(time.time() * 1000)
+            if ms <= self._last_ms:
+                ms = self._last_ms
+                self._counter += 1
+                if self._counter >= _MAX_COUNTER:
+                    ms, self._counter = ms + 1, 0
+            else:
+                self._counter = 0
+            self._last_ms = ms
+            counter = self._counter
+        suffix = base36(secrets.randbelow(36 ** RANDOM_WIDTH), RANDOM_WIDTH)
+        return base36(ms, TIME_WIDTH) + base36(counter, COUNTER_WIDTH) + suffix, ms
+
+
+@st.cache_resource(show_spinner=False)
+def _generator() -> IdGenerator:
+    return IdGenerator()
+
+
+def next_id() -> tuple:
+    """(id, epoch ms) from the process-wide generator (survives module reloads)."""
+    return _generator().next()
+
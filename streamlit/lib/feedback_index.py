@@ -0,0 +1,155 @@
+"""
+Per-snapshot indexes over the feedback table.
+
+Everything here is computed once per snapshot version (see
+feedback_db.Snapshot.derived) and then answers lookups without touching
+the full DataFrame again.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+COUNT_KEYS = ["page_id", "element_id", "round", "status"]
+FILTER_KEYS = ["round", "page_id", "element_id", "status"]
+
+
+@dataclass(frozen=True)
+class FeedbackCounts:
+    """Row counts per (page_id, element_id, round, status) and its marginals."""
+    total: int
+    by_key: dict       # (page_id, element_id, round, status) → n
+    by_element: dict   # (page_id, element_id) → n   (element_id None = page-level)
+    by_round: dict     # round → n
+    by_status: dict    # status → n
+
+
+def build_counts(df: pd.DataFrame) -> FeedbackCounts:
+    """Group the table once and derive all marginal counts from the groups."""
+    if df.empty:
+        return FeedbackCounts(0, {}, {}, {}, {})
+    sizes = df.groupby(COUNT_KEYS, dropna=False, observed=True).size()
+    by_key, by_element, by_round, by_status = {}, {}, {}, {}
+    for (page_id, element_id, round_num, status), n in sizes.items():
+        element_id = None if pd.isna(element_id) else element_id
+        round_num = int(round_num)
+        n = int(n)
+        by_key[(page_id, element_id, round_num, status)] = n
+        by_element[(page_id, element_id)] = by_element.get((page_id, element_id), 0) + n
+        by_round[round_num] = by_round.get(round_num, 0) + n
+        by_status[status] = by_status.get(status, 0) + n
+    return FeedbackCounts(len(df), by_key, by_element, by_round, by_status)
+
+
+class FilterIndex:
+    """Packed bitsets per distinct value of the filter columns.
+
+    ``bits[(column, value)]`` has bit i set when row i of the indexed
+    frame has that value (element_id None = page-level comment).  A filter
+    combination is one AND per filter over n/8 bytes plus a single take.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.n = len(df)
+        self.bits = {}
+        for column in FILTER_KEYS:
+            codes, uniques = pd.factorize(df[column], use_na_sentinel=True)
+            for code, value in enumerate(uniques):
+                key = int(value) if column == "round" else value
+                self.bits[(column, key)] = np.packbits(codes == code)
+            if column == "element_id" and (codes == -1).any():
+                self.bits[(column, None)] = np.packbits(codes == -1)
+
+    def positions(self, **filters) -> np.ndarray:
+        """Row positions matching all ``column=value`` filters, in frame order."""
+        acc = None
+        for column, value in filters.items():
+            bits = self.bits.get((column, value))
+            if bits is None:
+                return np.empty(0, dtype=np.intp)
+            acc = bits if acc is None else acc & bits
+        if acc is None:
+            return np.arange(self.n)
+        return np.flatnonzero(np.unpackbits(acc, count=self.n))
+
+    def select(self, **filters) -> pd.DataFrame:
+        """Matching rows as a new frame (index reset)."""
+        if not filters:
+            return self.df.reset_index(drop=True)
+        return self.df.take(self.positions(**filters)).reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class PageFeedback:
+    """One page's rows grouped by element_id (None = page-level), newest first."""
+    page_id: str
+    groups: dict          # element_id → DataFrame (index reset)
+    empty: pd.DataFrame   # zero-row frame with the table's columns
+
+    def rows(self, element_id) -> pd.DataFrame:
+        return self.groups.get(element_id, self.empty)
+
+    def count(self, element_id) -> int:
+        return len(self.groups.get(element_id, self.empty))
+
+
+def build_page_feedback(df: pd.DataFrame, page_id: str) -> PageFeedback:
+    """Select one page's rows and group them by element_id in a single pass."""
+    # Categorical compare: one pass over the codes, no bitset index needed
+    positions = np.flatnonzero(df["page_id"] == page_id)
+    codes, uniques = pd.factorize(df["element_id"].take(positions), use_na_sentinel=True)
+    # Stable: every group keeps the frame's newest-first order
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes + 1, minlength=len(uniques) + 1))
+    groups = {}
+    for code, (start, stop) in enumerate(zip(np.r_[0, bounds[:-1]], bounds), start=-1):
+        if stop > start:
+            key = None if code == -1 else uniques[code]
+            groups[key] = df.take(positions[order[start:stop]]).reset_index(drop=True)
+    return PageFeedback(page_id, groups, df.iloc[:0].reset_index(drop=True))
+
+
+class IdIndex:
+    """Binary-search lookups by id and by created_at window.
+
+    Ids are time-sortable (lib/feedback_ids.py) and the snapshot is sorted
+    newest first, so reading the id column backwards normally already gives
+    the sorted id array; only tables with legacy or imported ids pay for an
+    argsort.  Windows are searched directly in the created_at column.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        ids = df["id"].to_numpy(dtype=str)
+        order = np.arange(len(ids))[::-1]
+        if len(ids) > 1 and not (ids[order[:-1]] <= ids[order[1:]]).all():
+            order = np.argsort(ids, kind="stable")
+        self._order = order
+        self._ids = ids[order]
+        # created_at descending, NaT last → ascending view of the dated rows
+        created = df["created_at"].to_numpy()
+        self._dated = len(created) - int(np.isnat(created).sum())
+        # (contiguous copy: searchsorted would copy a reversed view on every call)
+        self._created = np.ascontiguousarray(created[:self._dated][::-1])
+
+    def position(self, feedback_id: str):
+        """Row position of ``feedback_id``, or None."""
+        i = np.searchsorted(self._ids, str(feedback_id))
+        if i < len(self._ids) and self._ids[i] == str(feedback_id):
+            return int(self._order[i])
+        return None
+
+    def window(self, since=None, until=None) -> slice:
+        """Positions of rows created in [since, until) as one contiguous slice."""
+        lo = 0 if since is None else np.searchsorted(self._created, as_datetime64(since, self._created))
+        hi = (self._dated if until is None
+              else np.searchsorted(self._created, as_datetime64(until, self._created)))
+        hi = max(int(hi), int(lo))
+        return slice(self._dated - hi, self._dated - int(lo))
+
+
+def as_datetime64(value, like: np.ndarray) -> np.datetime64:
+    """``value`` in the time unit of ``like``; a unit mismatch would make numpy
+    convert the whole array on every comparison."""
+    return np.datetime64(pd.Timestamp(value), np.datetime_data(like.dtype)[0])
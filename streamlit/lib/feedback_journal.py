@@ -0,0 +1,237 @@
+"""
+Durable write-ahead journal for feedback writes.
+
+Every write (new row or status change) is first appended as one JSON
+line to a local journal file and fsync'ed; only then is it queued for
+the backend.  A tester's submission is committed once it is on local
+disk, so a failing or throttled Google Sheet can delay it but not lose it.
+
+    {"seq": 7, "op": "append", "row": [...], "ts": 1760000000.0}
+    {"seq": 8, "op": "status", "changes": {"<id>": "resolved"}, "ts": ...}
+    {"ack": [7, 8]}
+
+Entries without an ack are replayed on the next start.  Replays must be
+idempotent: appends are matched against the backend by row id (see
+``feedback_db._SnapshotStore._apply``), status changes set absolute values.
+Once every entry is acknowledged the file is compacted (rewritten empty);
+a long run of acks without a quiet moment also triggers a compaction
+that keeps only the unacknowledged entries.
+
+Entries the backend rejects for good (e.g. a row it cannot store) are
+copied with the error to ``<name>-rejected.jsonl`` and acknowledged, so
+they are kept for inspection but no longer replayed.
+
+Each process holds an exclusive lock on one journal slot
+``<backend name>-<slot>.jsonl`` (``sqlite-0.jsonl``, ``sheets-0.jsonl``,
+``sheets-1.jsonl``, ...), so replicas sharing the directory never write
+to the same file.  On start a process also adopts
+the entries of slots whose owner is gone.
+"""
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: single process per journal directory
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+COMPACT_AFTER_ACKS = 1000  # compact even with entries pending after this many acks
+
+
+class Journal:
+    """Append-only JSONL journal in ``directory`` (one locked slot per process)."""
+
+    def __init__(self, directory, name: str = "feedback"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self._lock = threading.Lock()
+        self._lock_file, slot = self._claim_slot()
+        self.path = self.directory / f"{name}-{slot}.jsonl"
+        self._pending = {}  # seq → entry, in seq order
+        self._seq = 0
+        self._acks_since_compact = 0
+        for entry in _read(self.path):
+            self._load(entry)
+        self._file = open(self.path, "ab")
+        if _torn_tail(self.path):
+            # A crash mid-append left a partial line; the next entry would be
+            # glued onto it and lost on load, so rewrite the file first
+            self._compact()
+        self._adopt_orphans(slot)
+
+    # ── Writing ──────────────────────────────────────────────
+
+    def append(self, entry: dict) -> dict:
+        """Durably record ``entry`` (gets "seq" and "ts"); returns the stored entry."""
+        with self._lock:
+            self._seq += 1
+            entry = {"seq": self._seq, **entry, "ts": time.time()}
+            self._write([entry], sync=True)
+            self._pending[entry["seq"]] = entry
+        return entry
+
+    def ack(self, seqs: list):
+        """Mark entries as applied to the backend; compacts when nothing is pending."""
+        with self._lock:
+            seqs = [s for s in seqs if s in self._pending]
+            if not seqs:
+                return
+            # No fsync: losing an ack only means an idempotent replay
+            self._write([{"ack": seqs}], sync=False)
+            for s in seqs:
+                del self._pending[s]
+            self._acks_since_compact += len(seqs)
+            if not self._pending or self._acks_since_compact >= COMPACT_AFTER_ACKS:
+                self._compact()
+
+    def reject(self, entry: dict, error: str):
+        """Move ``entry`` to the rejected file (with ``error``) and acknowledge it."""
+        line = json.dumps({**entry, "error": error, "rejected_at": time.time()}, ensure_ascii=False)
+        # Shared by all slots: one O_APPEND write per entry keeps lines whole
+        with open(self.directory / f"{self.name}-rejected.jsonl", "ab") as f:
+            f.write((line + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        self.ack([entry["seq"]])
+
+    def pending(self) -> list:
+        """Entries not yet acknowledged, oldest first."""
+        with self._lock:
+            return list(self._pending.values())
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+            self._lock_file.close()
+
+    # ── Internals ────────────────────────────────────────────
+
+    def _load(self, entry: dict):
+        if "ack" in entry:
+            for s in entry["ack"]:
+                self._pending.pop(s, None)
+        else:
+            self._pending[entry["seq"]] = entry
+            self._seq = max(self._seq, entry["seq"])
+
+    def _write(self, entries: list, sync: bool):
+        data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+        self._file.write(data.encode("utf-8"))
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def _compact(self):
+        """Atomically rewrite the journal with only the pending entries (lock held)."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for entry in self._pending.values():
+                    f.write((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(tmp, self.path)
+            _fsync_dir(self.directory)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            if self._file.closed:
+                self._file = open(self.path, "ab")
+        self._acks_since_compact = 0
+
+    def _claim_slot(self):
+        for slot in range(1000):
+            lock_file = open(self.directory / f"{self.name}-{slot}.lock", "a+b")
+            if _try_lock(lock_file):
+                return lock_file, slot
+            lock_file.close()
+        raise RuntimeError(f"No free journal slot in {self.directory}")
+
+    def _adopt_orphans(self, own_slot: int):
+        """Move pending entries of unlocked (dead owner) slots into this journal."""
+        pattern = re.compile(rf"{re.escape(self.name)}-(\d+)\.jsonl$")
+        for path in sorted(self.directory.glob(f"{self.name}-*.jsonl")):
+            match = pattern.match(path.name)
+            if not match or int(match.group(1)) == own_slot:
+                continue
+            lock_file = open(self.directory / f"{self.name}-{match.group(1)}.lock", "a+b")
+            try:
+                if not _try_lock(lock_file):
+                    continue  # owned by a running process
+                orphan = {}
+                for entry in _read(path):
+                    if "ack" in entry:
+                        for s in entry["ack"]:
+                            orphan.pop(s, None)
+                    else:
+                        orphan[entry["seq"]] = entry
+                if orphan:
+                    log.info("Adopting %d journal entries from %s", len(orphan), path.name)
+                    with self._lock:
+                        adopted = []
+                        for entry in orphan.values():
+                            self._seq += 1
+                            adopted.append({**entry, "seq": self._seq})
+                        self._write(adopted, sync=True)
+                        self._pending.update((e["seq"], e) for e in adopted)
+                path.unlink()
+            finally:
+                lock_file.close()
+
+
+def _read(path: Path) -> list:
+    """Entries of a journal file; a torn last line (crash mid-write) is skipped."""
+    if not path.exists():
+        return []
+    entries = []
+    with open(path, "rb") as f:
+        for number, line in enumerate(f, 1):
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                log.warning("Skipping unreadable journal line %d in %s", number, path.name)
+    return entries
+
+
+def _torn_tail(path: Path) -> bool:
+    """True if the file does not end with a complete line."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def _try_lock(f) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _fsync_dir(directory: Path):
+    # Makes the rename durable; not supported on every platform
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
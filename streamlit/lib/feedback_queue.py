@@ -0,0 +1,140 @@
+"""
+Write-behind queue for feedback submissions.
+
+``put()`` only buffers the item and returns immediately.  A background
+flusher thread groups everything that is pending into a single backend
+call and retries with exponential backoff when the call fails, so a
+slow or throttled backend never blocks a tester.
+
+With a journal (lib/feedback_journal.py) items are written to local disk
+before ``put()`` returns, acknowledged after they were flushed, and
+entries left over from a previous process are queued again on start.
+
+A batch that fails with a permanent error (``is_permanent``) is split
+until the rejected items are isolated; those are moved to the journal's
+rejected file and dropped, so one bad entry cannot block the queue.
+"""
+import atexit
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    """Buffer items in memory and flush them in batches from a daemon thread.
+
+    flush:       callable(batch: list, retry: bool) that writes one batch and
+                 raises on failure; ``retry`` is set when (part of) the batch
+                 may already have been written by an earlier attempt
+    on_flushed:  callable(batch: list) invoked after a batch was written
+    is_permanent: callable(error) → True if retrying the failed batch cannot
+                 succeed; by default every error counts as transient
+    on_rejected: callable(item, error) invoked for each item that was dropped
+    interval:    seconds to wait for more items before flushing a batch
+    max_batch:   upper bound for items per backend call
+    journal:     optional Journal; items must then be JSON-serializable dicts
+    """
+
+    def __init__(self, flush, on_flushed=None, interval: float = 1.0,
+                 max_batch: int = 100, max_backoff: float = 60.0, journal=None,
+                 is_permanent=None, on_rejected=None):
+        self._flush = flush
+        self._on_flushed = on_flushed
+        self._is_permanent = is_permanent or (lambda error: False)
+        self._on_rejected = on_rejected
+        self._interval = interval
+        self._max_batch = max_batch
+        self._max_backoff = max_backoff
+        self._journal = journal
+        self._pending = journal.pending() if journal else []
+        self._uncertain = len(self._pending)  # leading items that may be written already
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()  # one batch in flight at a time
+        self._thread = threading.Thread(target=self._run, name="feedback-flusher", daemon=True)
+        self._thread.start()
+        atexit.register(self.drain)
+
+    def put(self, item):
+        """Queue ``item``; with a journal it is on disk when this returns."""
+        with self._cond:
+            # Journal order = replay order, so append under the same lock
+            if self._journal:
+                item = self._journal.append(item)
+            self._pending.append(item)
+            self._cond.notify()
+        return item
+
+    def pending(self) -> list:
+        """Items that were queued but not yet written."""
+        with self._cond:
+            return list(self._pending)
+
+    def drain(self, timeout: float = 10.0):
+        """Try to flush everything now (used at interpreter exit)."""
+        deadline = time.monotonic() + timeout
+        while self.pending() and time.monotonic() < deadline:
+            if not self._flush_once():
+                break
+
+    def _run(self):
+        backoff = 1.0
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            # Give concurrent submissions a moment to join the same batch
+            time.sleep(self._interval)
+            if self._flush_once():
+                backoff = 1.0
+            else:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+
+    def _flush_once(self) -> bool:
+        with self._flush_lock:
+            return self._flush_pending()
+
+    def _flush_pending(self) -> bool:
+        with self._cond:
+            batch = self._pending[:self._max_batch]
+        if not batch:
+            return True
+        return self._write(batch)
+
+    def _write(self, batch: list) -> bool:
+        """Flush ``batch`` (the head of the queue); False on a transient error."""
+        try:
+            self._flush(batch, self._uncertain > 0)
+        except Exception as e:
+            # The call may have reached the backend before failing
+            self._uncertain = max(self._uncertain, len(batch))
+            if not self._is_permanent(e):
+                log.exception("Flushing %d feedback item(s) failed, will retry", len(batch))
+                return False
+            if len(batch) == 1:
+                self._reject(batch[0], e)
+                return True
+            # Halve until the rejected items are found; the rest still goes through
+            half = len(batch) // 2
+            return self._write(batch[:half]) and self._write(batch[half:])
+        self._remove(len(batch))
+        if self._journal:
+            self._journal.ack([item["seq"] for item in batch])
+        if self._on_flushed:
+            self._on_flushed(batch)
+        return True
+
+    def _reject(self, item, error: Exception):
+        log.error("Dropping feedback item the backend rejects: %s (%r)", error, item)
+        self._remove(1)
+        if self._journal:
+            self._journal.reject(item, repr(error))
+        if self._on_rejected:
+            self._on_rejected(item, error)
+
+    def _remove(self, n: int):
+        with self._cond:
+            del self._pending[:n]
+        self._uncertain = max(0, self._uncertain - n)
@@ -0,0 +1,214 @@
+"""
+Full-text search over feedback comments and authors.
+
+``SearchIndex`` is an inverted index (term → {feedback id: weight})
+with BM25 ranking.  Tokenization is German-aware: lower case, umlauts
+folded (ä → ae, ß → ss, so "Größe" and "groesse" match), other accents
+stripped, common stop words dropped and a light suffix stemmer applied
+("Farben" / "Farbe" → "farb").  The last query word also matches as a
+prefix, so results appear while typing.
+
+The index is keyed by feedback id, not row position, so it can be
+carried over to the next snapshot and extended with new rows instead of
+being rebuilt (see feedback_db._SnapshotStore._publish).
+"""
+import bisect
+import math
+import re
+import threading
+import unicodedata
+from array import array
+
+import numpy as np
+import pandas as pd
+
+AUTHOR_WEIGHT = 2      # an author match counts like two comment words
+MAX_PREFIX_TERMS = 50  # expansions of a prefix query word
+_K1, _B = 1.2, 0.75    # BM25 parameters
+
+_FOLD_PAIRS = (("ä", "ae"), ("ö", "oe"), ("ü", "ue"), ("ß", "ss"))
+_FOLD = str.maketrans(dict(_FOLD_PAIRS))
+_WORD = re.compile(r"[a-z0-9]+")
+_SUFFIXES = ("ern", "em", "en", "er", "es", "e", "n", "s")
+STOPWORDS = frozenset(
+    "der die das den dem des ein eine einen einem einer eines und oder aber "
+    "ist sind war nicht kein keine zu im in am an auf aus bei mit von vom fuer "
+    "ich du er sie es wir ihr man auch noch nur sehr so wie als dass da hier "
+    "the a an and or of to is".split()
+)
+
+
+_stems = {}  # word → stem (the vocabulary is small, so memoize)
+
+
+def _stem(word: str) -> str:
+    stem = _stems.get(word)
+    if stem is None:
+        stem = word
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                stem = word[:-len(suffix)]
+                break
+        _stems[word] = stem
+    return stem
+
+
+def normalize(text: str) -> str:
+    """Lower-case, fold umlauts and strip remaining accents."""
+    text = str(text).lower().translate(_FOLD)
+    if text.isascii():
+        return text
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def tokenize(text) -> list:
+    """Search terms of ``text`` (normalized, stop words removed, stemmed)."""
+    if text is None or (isinstance(text, float) and math.isnan(text)):
+        return []
+    return [_stem(w) for w in _WORD.findall(normalize(text)) if w not in STOPWORDS]
+
+
+def _term_frame(texts: pd.Series, weight: int) -> pd.DataFrame:
+    """(doc position, term, weight) for every term of every text — ``tokenize`` for a column."""
+    norm = texts.fillna("").astype(str).str.lower().reset_index(drop=True)
+    for umlaut, folded in _FOLD_PAIRS:
+        norm = norm.str.replace(umlaut, folded, regex=False)
+    accented = norm.str.contains(r"[^\x00-\x7f]", regex=True)
+    if accented.any():
+        norm[accented] = norm[accented].map(normalize)
+    words = norm.str.replace("[^a-z0-9]+", " ", regex=True).str.split().explode().dropna()
+    codes, uniques = pd.factorize(words)
+    stems = np.array([None if w in STOPWORDS else _stem(w) for w in uniques], dtype=object)
+    terms = stems[codes]
+    keep = pd.notna(terms)
+    return pd.DataFrame({"doc": words.index.to_numpy()[keep], "term": terms[keep], "w": weight})
+
+
+class SearchIndex:
+    """Inverted index over comment + author, ranked with BM25.
+
+    Documents are numbered in insertion order; each posting list is a pair
+    of growable arrays (doc numbers, weights), so adding a row is a few
+    appends and scoring a term is vectorized over its postings.
+    """
+
+    def __init__(self, df: pd.DataFrame = None):
+        self._lock = threading.Lock()
+        self._ids = []                  # doc number → feedback id
+        self._docnum = {}               # feedback id → doc number
+        self._lengths = array("f")      # doc number → weighted length
+        self._postings = {}             # term → (array("q") doc numbers, array("f") weights)
+        self._terms = None              # sorted vocabulary for prefix lookups (lazy)
+        if df is not None:
+            self.add_missing(df)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, doc_id: str, comment, author):
+        """Index one entry (no-op if ``doc_id`` is already indexed)."""
+        with self._lock:
+            self._add(str(doc_id), comment, author)
+
+    def add_missing(self, df: pd.DataFrame):
+        """Index every row of ``df`` whose id is not indexed yet (vectorized)."""
+        if df.empty:
+            return
+        with self._lock:
+            new = df[~df["id"].isin(self._ids)] if self._ids else df
+            new = new.drop_duplicates("id")
+            if new.empty:
+                return
+            first = len(self._ids)
+            terms = pd.concat([_term_frame(new["comment"], 1),
+                               _term_frame(new["author"], AUTHOR_WEIGHT)])
+            weights = terms.groupby(["term", "doc"], sort=True)["w"].sum()
+            lengths = np.bincount(weights.index.get_level_values("doc"), weights=weights.to_numpy(),
+                                  minlength=len(new)).astype(np.float32)
+
+            docs = weights.index.get_level_values("doc").to_numpy(dtype=np.int64) + first
+            values = weights.to_numpy(dtype=np.float32)
+            bounds = np.flatnonzero(np.diff(weights.index.codes[0])) + 1
+            starts = np.concatenate([[0], bounds])
+            ends = np.concatenate([bounds, [len(values)]])
+            term_names = weights.index.get_level_values("term")
+            for start, end in zip(starts, ends):
+                term = term_names[start]
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("q"), array("f"))
+                    self._terms = None
+                postings[0].frombytes(docs[start:end].tobytes())
+                postings[1].frombytes(values[start:end].tobytes())
+
+            ids = [str(i) for i in new["id"]]
+            self._docnum.update(zip(ids, range(first, first + len(ids))))
+            self._ids.extend(ids)
+            self._lengths.frombytes(lengths.tobytes())
+
+    def _add(self, doc_id: str, comment, author):
+        if doc_id in self._docnum:
+            return
+        weights = {}
+        for term in tokenize(comment):
+            weights[term] = weights.get(term, 0) + 1
+        for term in tokenize(author):
+            weights[term] = weights.get(term, 0) + AUTHOR_WEIGHT
+        num = len(self._ids)
+        for term, w in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("q"), array("f"))
+                self._terms = None
+            postings[0].append(num)
+            postings[1].append(w)
+        self._ids.append(doc_id)
+        self._docnum[doc_id] = num
+        self._lengths.append(sum(weights.values()))
+
+    def search(self, query: str, limit: int = None) -> dict:
+        """Ids matching every query word → BM25 score, best first."""
+        words = tokenize(query)
+        if not words:
+            return {}
+        with self._lock:
+            n = len(self._ids)
+            if not n:
+                return {}
+            lengths = np.frombuffer(self._lengths, dtype=np.float32).astype(np.float64)
+            norm = _K1 * (1 - _B + _B * lengths / lengths.mean())
+            total = np.zeros(n)
+            matched = None
+            for i, word in enumerate(words):
+                # The last word may still be typed: match it as a prefix too
+                terms = self._prefix_terms(word) if i == len(words) - 1 else [word]
+                word_score = np.zeros(n)
+                for term in terms:
+                    docs, weights = self._postings.get(term, ((), ()))
+                    if not docs:
+                        continue
+                    docs = np.frombuffer(docs, dtype=np.int64).copy()
+                    tf = np.frombuffer(weights, dtype=np.float32).astype(np.float64)
+                    idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+                    score = idf * tf * (_K1 + 1) / (tf + norm[docs])
+                    word_score[docs] = np.maximum(word_score[docs], score)
+                hit = word_score > 0
+                matched = hit if matched is None else matched & hit
+                total += word_score
+            ids = self._ids
+            hits = np.flatnonzero(matched)
+            if not len(hits):
+                return {}
+            ranked = hits[np.argsort(-total[hits], kind="stable")][:limit]
+            return {ids[i]: float(total[i]) for i in ranked}
+
+    def _prefix_terms(self, word: str) -> list:
+        if self._terms is None:
+            self._terms = sorted(self._postings)
+        start = bisect.bisect_left(self._terms, word)
+        terms = []
+        for term in self._terms[start:start + MAX_PREFIX_TERMS]:
+            if not term.startswith(word):
+                break
+            terms.append(term)
+        return terms
@@ -1,37 +1,107 @@
 """
 Reusable feedback UI components for all dashboard pages.
 Supports both page-level and element-level feedback.
+
+After ``start_prefetch()`` (called by app.py) the feedback snapshot loads
+in the background: ``section_with_feedback`` only reserves a slot for its
+popover, and the popovers are filled in by ``feedback_section`` (or
+``render_deferred``) once the charts above them have been drawn.
+
+The widgets are fragments (``st.fragment``): submitting or toggling reruns
+only the popover or page-feedback block, not the page with its charts.
+Writes happen in widget callbacks, before the fragment body runs, and
+the shared snapshot shows them right away (feedback_db keeps a local
+overlay), so one fragment run per interaction draws the new state.
+The sidebar stats catch up on the next full rerun.
 """
 import streamlit as st
-from lib import feedback_db
+from lib import feedback_db, perf, settings
 from lib.theme import GREEN, YELLOW, TEXT_DIM, ACCENT1
 
+_DEFERRED = "_feedback_deferred"  # session key: popovers waiting for the snapshot
+
+
+def start_prefetch():
+    """Start loading feedback in the background and defer element popovers this run."""
+    st.session_state[_DEFERRED] = []
+    feedback_db.prefetch()
+
+
+def render_deferred():
+    """Fill the popover slots reserved by ``section_with_feedback`` (waits for the snapshot)."""
+    pending = st.session_state.get(_DEFERRED) or []
+    st.session_state[_DEFERRED] = []
+    for slot, page_id, element_id, label in pending:
+        with slot.container():
+            element_feedback(page_id, element_id, label)
+
+
+def _submit(page_id: str, element_id, round_num: int, prefix: str):
+    """Form callback: store the entry if name and comment are filled in."""
+    author = st.session_state[f"{prefix}_a"].strip()
+    comment = st.session_state[f"{prefix}_c"].strip()
+    if author and comment:
+        feedback_db.add_feedback(page_id, round_num, author, comment,
+                                 st.session_state[f"{prefix}_r"], element_id)
+
+
+def _toggle(feedback_id: str, status: str):
+    """Button callback: flip open ↔ resolved."""
+    feedback_db.update_status(feedback_id, "resolved" if status == "open" else "open")
+
+
+# Comment lists show the newest entries a page at a time, which keeps
+# fragment reruns cheap on long histories.
+
+def _shown(prefix: str) -> int:
+    """Number of comments currently shown in the list ``prefix``."""
+    return st.session_state.get(f"{prefix}_shown", settings.get("feedback", "history_page_size", 20))
 
+
+def _more_button(prefix: str, total: int, shown: int):
+    if total > shown:
+        step = settings.get("feedback", "history_page_size", 20)
+        st.button(f"Ältere anzeigen ({total - shown})", key=f"{prefix}_more",
+                  on_click=_show_more, args=(f"{prefix}_shown", shown + step))
+
+
+def _show_more(key: str, shown: int):
+    st.session_state[key] = shown
+
+
+@st.fragment
 def element_feedback(page_id: str, element_id: str, label: str):
     """Render a compact element-level feedback widget using st.popover."""
+    with perf.timer("fragment.element_feedback"):
+        _element_feedback(page_id, element_id, label)
+
+
+def _element_feedback(page_id: str, element_id: str, label: str):
     current_round = st.session_state.get("current_round", 1)
-    count = feedback_db.get_element_count(page_id, element_id)
+    prefix = f"ef_{page_id}_{element_id}"
+    feedback = feedback_db.get_page_feedback(page_id)
+    count = feedback.count(element_id)
 
     badge = f"💬 {count}" if count > 0 else "💬"
     with st.popover(badge, use_container_width=False):
         st.markdown(f"**Feedback:** {label}")
         with st.form(f"ef_{page_id}_{element_id}_r{current_round}", clear_on_submit=True):
-            author = st.text_input("Name", placeholder="Dein Name", key=f"ef_a_{page_id}_{element_id}")
-            comment = st.text_area("Kommentar", placeholder="Was fällt dir auf?", key=f"ef_c_{page_id}_{element_id}", height=80)
-            rating = st.slider("Bewertung", 1, 5, 3, key=f"ef_r_{page_id}_{element_id}")
-            if st.form_submit_button("Absenden", use_container_width=True):
-                if author.strip() and comment.strip():
-                    feedback_db.add_feedback(page_id, current_round, author.strip(), comment.strip(), rating, element_id)
-                    st.rerun()
+            st.text_input("Name", placeholder="Dein Name", key=f"{prefix}_a")
+            st.text_area("Kommentar", placeholder="Was fällt dir auf?", key=f"{prefix}_c", height=80)
+            st.slider("Bewertung", 1, 5, 3, key=f"{prefix}_r")
+            st.form_submit_button("Absenden", use_container_width=True, on_click=_submit,
+                                  args=(page_id, element_id, current_round, prefix))
 
         # Show existing feedback for this element
-        df = feedback_db.get_feedback(page_id=page_id, element_id=element_id)
+        df = feedback.rows(element_id)
         if not df.empty:
             st.markdown(f"---\n**{len(df)} Kommentar{'e' if len(df) != 1 else ''}:**")
-            for _, row in df.iterrows():
+            shown = _shown(prefix)
+            for _, row in df.head(shown).iterrows():
                 stars = "★" * int(row["rating"])
                 status_icon = "✅" if row["status"] == "resolved" else "🔲"
                 st.markdown(f"{status_icon} **{row['author']}** (R{row['round']}) {stars}  \n{row['comment']}")
+            _more_button(prefix, len(df), shown)
 
 
 def section_with_feedback(page_id: str, element_id: str, title: str, subtitle: str = ""):
@@ -50,35 +120,51 @@ def section_with_feedback(page_id: str, element_id: str, title: str, subtitle: s
             {sub_html}
         </div>""", unsafe_allow_html=True)
     with col_fb:
-        element_feedback(page_id, element_id, title)
+        pending = st.session_state.get(_DEFERRED)
+        if pending is None:
+            element_feedback(page_id, element_id, title)
+        else:
+            pending.append((st.empty(), page_id, element_id, title))
 
 
 def feedback_section(page_id: str):
-    """Render page-level feedback form + styled history."""
+    """Render the deferred element popovers, then page-level feedback."""
+    render_deferred()
+    page_feedback(page_id)
+
+
+@st.fragment
+def page_feedback(page_id: str):
+    """Page-level feedback form + styled history."""
+    with perf.timer("fragment.page_feedback"):
+        _page_feedback(page_id)
+
+
+def _page_feedback(page_id: str):
     current_round = st.session_state.get("current_round", 1)
+    prefix = f"pf_{page_id}"
 
     st.markdown("---")
     st.markdown("#### 💬 Allgemeines Feedback zur Seite")
 
     with st.form(f"feedback_{page_id}_r{current_round}", clear_on_submit=True):
         fc1, fc2 = st.columns([3, 1])
-        author = fc1.text_input("Dein Name", placeholder="z.B. Max Müller")
-        rating = fc2.slider("Bewertung", 1, 5, 3)
-        comment = st.text_area("Kommentar", placeholder="Layout, fehlende Elemente, Reihenfolge...")
-        submitted = st.form_submit_button("📩 Absenden", use_container_width=True)
-        if submitted and author.strip() and comment.strip():
-            feedback_db.add_feedback(page_id, current_round, author.strip(), comment.strip(), rating)
-            st.rerun()
+        fc1.text_input("Dein Name", placeholder="z.B. Max Müller", key=f"{prefix}_a")
+        fc2.slider("Bewertung", 1, 5, 3, key=f"{prefix}_r")
+        st.text_area("Kommentar", placeholder="Layout, fehlende Elemente, Reihenfolge...", key=f"{prefix}_c")
+        st.form_submit_button("📩 Absenden", use_container_width=True, on_click=_submit,
+                              args=(page_id, None, current_round, prefix))
 
     # History: page-level only (element_id IS NULL)
-    df_fb = feedback_db.get_feedback(page_id=page_id, element_id=None)
+    df_fb = feedback_db.get_page_feedback(page_id).rows(None)
     if not df_fb.empty:
         st.markdown(f"""<div style="font-size:12px; font-weight:600; color:#6b7280;
             text-transform:uppercase; margin: 16px 0 8px 0; letter-spacing:0.5px;">
             Seitenkommentare ({len(df_fb)})
         </div>""", unsafe_allow_html=True)
 
-        for _, row in df_fb.iterrows():
+        shown = _shown(prefix)
+        for _, row in df_fb.head(shown).iterrows():
             stars = "★" * int(row["rating"]) + "☆" * (5 - int(row["rating"]))
             is_resolved = row["status"] == "resolved"
             css_class = "feedback-item resolved" if is_resolved else "feedback-item"
@@ -101,7 +187,7 @@ def feedback_section(page_id: str):
             col_spacer, col_btn = st.columns([6, 1])
             with col_btn:
                 btn_label = "✅ Erledigt" if is_resolved else "🔲 Offen"
-                if st.button(btn_label, key=f"toggle_{page_id}_{row['id']}", use_container_width=True):
-                    new_status = "resolved" if row["status"] == "open" else "open"
-                    feedback_db.update_status(int(row["id"]), new_status)
-                    st.rerun()
+                st.button(btn_label, key=f"toggle_{page_id}_{row['id']}", use_container_width=True,
+                          on_click=_toggle, args=(row["id"], row["status"]))
+
+        _more_button(prefix, len(df_fb), shown)
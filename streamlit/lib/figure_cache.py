@@ -0,0 +1,51 @@
+"""
+Process-wide cache of built Plotly figures.
+
+Building a figure (traces + ``plotly_layout()``) is the most expensive
+part of a dashboard page, yet its inputs only change when the data
+source or the theme does.  ``cached_figure()`` keys each figure by
+(chart id, data version, theme key), so reruns triggered by e.g. a
+feedback popover reuse the finished figure instead of rebuilding it.
+The key does not cover the builder's code, so app.py clears the cache
+whenever lib/reloader.py reloads a changed module.
+
+The cache holds ``go.Figure`` objects rather than their dict/JSON form:
+``st.plotly_chart`` re-validates a dict through ``go.Figure(**dict)``,
+which would cost as much as building it, while a Figure is only copied
+and serialized.  Cached figures are shared — never mutate them.
+"""
+import hashlib
+import json
+
+import streamlit as st
+
+from lib import mock_data, perf
+from lib.theme import plotly_layout
+
+# Changes whenever the Plotly styling in lib/theme.py does
+THEME_KEY = hashlib.blake2b(
+    json.dumps(plotly_layout(), sort_keys=True).encode(), digest_size=8
+).hexdigest()
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build(chart_id: str, data_version: str, theme_key: str, _build_fn):
+    perf.cache_miss("figure")
+    with perf.timer(f"figure.build.{chart_id}"):
+        return _build_fn()
+
+
+def cached_figure(chart_id: str, build, data_version: str = None):
+    """Return the figure for ``chart_id``, calling ``build()`` only on a cache miss.
+
+    ``data_version`` defaults to the version of the dashboard data source.
+    """
+    if data_version is None:
+        data_version = mock_data.data_version()
+    perf.cache_lookup("figure")
+    return _build(chart_id, data_version, THEME_KEY, build)
+
+
+def clear():
+    """Drop all cached figures (app.py calls this after a module reload)."""
+    _build.clear()
@@ -1,22 +1,63 @@
 """
 Load shared mock data and convert to Pandas DataFrames.
+
+The source (``shared/mock-data.json`` by default, or a directory of CSV
+drops — see the ``[data] source`` setting) goes through a columnar cache
+keyed by its mtime (lib/data_cache.py), so only the first start parses it.
+
+``df_monthly``, ``df_regions``, ``df_competitors`` and ``kpis`` are lazy
+module attributes: they load on first access and reload when the source
+changes.  Read them as ``mock_data.df_monthly`` at render time rather
+than binding them at import time.  ``df_monthly`` and ``df_competitors``
+carry a precomputed ``month_label`` column; treat all frames as read-only.
 """
-import json
 from pathlib import Path
+
 import pandas as pd
 
+from lib import data_cache, settings
+
 _DATA_PATH = Path(__file__).parent.parent.parent / "shared" / "mock-data.json"
+_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "data"
+
+_ATTRS = {
+    "df_monthly": "monthly",
+    "df_regions": "regions",
+    "df_competitors": "competitors",
+    "kpis": "kpis",
+}
+
+_loaded = None  # (version, data dict)
+
 
-def _load():
-    with open(_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _source() -> Path:
+    return Path(settings.get("data", "source", str(_DATA_PATH)))
 
-_raw = _load()
 
-df_monthly = pd.DataFrame(_raw["monthly"])
-df_regions = pd.DataFrame(_raw["regions"])
-df_competitors = pd.DataFrame(_raw["competitors"])
-kpis = _raw["kpis"]
+def data_version() -> str:
+    """Key of the current source data; changes when the source file changes."""
+    return data_cache.source_version(_source())
+
+
+def _data() -> dict:
+    global _loaded
+    source = _source()
+    version = data_cache.source_version(source)
+    if _loaded is None or _loaded[0] != version:
+        cache_dir = Path(settings.get("data", "cache_dir", str(_CACHE_DIR)))
+        data = data_cache.load(source, version, cache_dir)
+        # Chart labels are derived once per source version, not per rerun
+        for name in ("monthly", "competitors"):
+            data[name]["month_label"] = month_labels(data[name]["month"])
+        _loaded = (version, data)
+    return _loaded[1]
+
+
+def __getattr__(name):
+    if name in _ATTRS:
+        return _data()[_ATTRS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Month labels (German)
 MONTH_LABELS = {
@@ -29,3 +70,10 @@ def short_month(m: str) -> str:
     """Convert '2025-05' to 'Mai 25'."""
     parts = m.split("-")
     return MONTH_LABELS.get(parts[1], parts[1]) + " " + parts[0][2:]
+
+
+def month_labels(months: pd.Series) -> pd.Series:
+    """Vectorized ``short_month`` for a whole column of 'YYYY-MM' strings."""
+    months = months.astype(str)
+    mm = months.str[5:7]
+    return mm.map(MONTH_LABELS).fillna(mm) + " " + months.str[2:4]
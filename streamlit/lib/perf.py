@@ -0,0 +1,197 @@
+"""
+In-process performance instrumentation.
+
+Operations are timed with ``timer()`` (context manager) or ``timed()``
+(decorator); each call is stored as an event (operation, duration,
+bytes, ok) in a bounded ring buffer shared by all sessions of the
+process.  Counters cover things that are not timed individually:
+``count()`` for e.g. Sheets API calls and retries, ``cache_lookup()`` /
+``cache_miss()`` for cache hit ratios.
+
+    with perf.timer("sheets.get") as t:
+        values = ws.get(...)
+        t.bytes = perf.approx_bytes(values)
+
+    @perf.timed("feedback.get_feedback")
+    def get_feedback(...): ...
+
+``summary()`` turns the buffer into p50/p95/p99 per operation;
+``export_json()`` dumps everything for offline analysis (pages/performance.py).
+"""
+import collections
+import functools
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, StopException
+
+from lib import settings
+
+# st.rerun() / st.stop() unwind through timers but are not failures
+_CONTROL_FLOW = (RerunException, StopException)
+
+SUMMARY_COLUMNS = ["operation", "count", "errors", "p50_ms", "p95_ms", "p99_ms",
+                   "max_ms", "total_ms", "bytes"]
+
+
+class Recorder:
+    """Ring buffer of timed events plus monotonically increasing counters."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._events = collections.deque(maxlen=capacity)  # (wall time, op, ms, bytes, ok)
+        self._counters = collections.Counter()
+        self.recorded = 0  # events ever recorded (also serves as a data version)
+
+    def add(self, op: str, ms: float, nbytes: int = 0, ok: bool = True):
+        with self._lock:
+            self._events.append((time.time(), op, ms, nbytes, ok))
+            self.recorded += 1
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] += n
+
+    def events(self) -> list:
+        with self._lock:
+            return list(self._events)
+
+    def counters(self) -> dict:
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+
+@st.cache_resource(show_spinner=False)
+def recorder() -> Recorder:
+    """The process-wide recorder (survives module reloads)."""
+    return Recorder(settings.get("perf", "buffer_size", 10_000))
+
+
+# ── Recording ─────────────────────────────────────────────────
+
+
+class timer:
+    """Context manager timing one operation; set ``.bytes`` to record payload size."""
+
+    __slots__ = ("op", "bytes", "_start")
+
+    def __init__(self, op: str):
+        self.op = op
+        self.bytes = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (time.perf_counter() - self._start) * 1000
+        ok = exc_type is None or issubclass(exc_type, _CONTROL_FLOW)
+        recorder().add(self.op, ms, self.bytes, ok)
+        return False
+
+
+def timed(op: str, size=None):
+    """Decorator form of ``timer``; ``size(result)`` gives the bytes to record."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timer(op) as t:
+                result = fn(*args, **kwargs)
+                if size is not None:
+                    t.bytes = size(result)
+                return result
+        return wrapper
+    return decorate
+
+
+def count(name: str, n: int = 1):
+    """Add ``n`` to counter ``name`` (e.g. "sheets.api_calls")."""
+    recorder().count(name, n)
+
+
+def cache_lookup(cache: str):
+    """Count one lookup in ``cache``; pair with ``cache_miss`` inside the miss path."""
+    recorder().count(f"cache.{cache}.lookups")
+
+
+def cache_miss(cache: str):
+    recorder().count(f"cache.{cache}.misses")
+
+
+def approx_bytes(obj) -> int:
+    """Rough payload size of API results (lists/dicts of scalars), as text."""
+    if isinstance(obj, dict):
+        return sum(len(str(k)) + approx_bytes(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sum(approx_bytes(v) for v in obj)
+    return 0 if obj is None else len(str(obj))
+
+
+# ── Reporting ─────────────────────────────────────────────────
+
+
+def events_frame() -> pd.DataFrame:
+    events = recorder().events()
+    df = pd.DataFrame(events, columns=["time", "operation", "ms", "bytes", "ok"])
+    df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
+    return df
+
+
+def summary() -> pd.DataFrame:
+    """Latency percentiles per operation over the events in the buffer."""
+    df = events_frame()
+    if df.empty:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS)
+    rows = []
+    for op, group in df.groupby("operation", sort=True):
+        ms = group["ms"].to_numpy()
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        rows.append([op, len(ms), int((~group["ok"]).sum()), p50, p95, p99,
+                     ms.max(), ms.sum(), int(group["bytes"].sum())])
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+
+def cache_ratios() -> pd.DataFrame:
+    """Lookups, hits, misses and hit ratio per instrumented cache."""
+    counters = recorder().counters()
+    rows = []
+    for name in sorted({k.split(".")[1] for k in counters if k.startswith("cache.")}):
+        lookups = counters.get(f"cache.{name}.lookups", 0)
+        misses = counters.get(f"cache.{name}.misses", 0)
+        hits = max(lookups - misses, 0)
+        rows.append([name, lookups, hits, misses, hits / lookups if lookups else float("nan")])
+    return pd.DataFrame(rows, columns=["cache", "lookups", "hits", "misses", "hit_ratio"])
+
+
+def export_json(include_events: bool = True) -> str:
+    """Summary, cache ratios, counters and (optionally) raw events as JSON."""
+    rec = recorder()
+    data = {
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "since": datetime.fromtimestamp(rec.started_at, timezone.utc).isoformat(),
+        "buffer": {"capacity": rec.capacity, "recorded": rec.recorded},
+        "operations": _records(summary()),
+        "caches": _records(cache_ratios()),
+        "counters": rec.counters(),
+    }
+    if include_events:
+        data["events"] = _records(events_frame())
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _records(df: pd.DataFrame) -> list:
+    # to_json maps NaN to null and timestamps to ISO strings
+    return json.loads(df.to_json(orient="records", date_format="iso"))
@@ -0,0 +1,107 @@
+"""
+Conditional module reloading for app.py.
+
+Streamlit re-executes app.py on every rerun but keeps imported modules in
+sys.modules.  On Streamlit Cloud a redeploy can leave stale modules (and
+stale .pyc files) behind, which is why app.py used to importlib.reload()
+every lib/pages module on every rerun.
+
+``refresh()`` keeps that guarantee but only reloads a module when the
+content hash of its source file changed since it was last loaded:
+
+  - a module seen for the first time in this process is reloaded once
+    (it may have been imported by an older deploy)
+  - a changed module gets its cached .pyc removed before reloading, so an
+    unchanged mtime cannot resurrect old bytecode
+  - once a module is reloaded, every module after it in the list is
+    reloaded too, because they bind names from the earlier ones
+
+Saved time is estimated from how long each skipped module took at its
+last load (for a first import this includes its third-party imports, so
+it is an upper bound).  This module is deliberately not reloaded itself:
+its state has to survive reruns.
+"""
+import hashlib
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import time
+
+log = logging.getLogger(__name__)
+
+_hashes = {}  # module name → source hash at last (re)load
+_costs = {}   # module name → seconds the last (re)load took
+_stats = {"reruns": 0, "reloads": 0, "skips": 0, "saved_seconds": 0.0}
+# Modules that were already loaded before this module (e.g. by an older deploy)
+_preexisting = frozenset(sys.modules)
+
+
+def _source_hash(module) -> str:
+    path = getattr(module, "__file__", None)
+    if not path or not os.path.exists(path):
+        return ""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _drop_bytecode(module):
+    path = getattr(module, "__file__", None)
+    if not path:
+        return
+    try:
+        os.remove(importlib.util.cache_from_source(path))
+    except (OSError, NotImplementedError, ValueError):
+        pass
+
+
+def refresh(names: list, lazy=()) -> list:
+    """Import or reload ``names`` in order; return the names that were (re)loaded.
+
+    Modules in ``lazy`` are not imported here — they are imported on first
+    use (e.g. a page or gspread) and only tracked once they are loaded.
+    """
+    _stats["reruns"] += 1
+    skips_before = _stats["skips"]
+    loaded = []
+    cascade = False
+    saved = 0.0
+    for name in names:
+        module = sys.modules.get(name)
+        t0 = time.perf_counter()
+        if module is None:
+            if name in lazy:
+                continue
+            module = importlib.import_module(name)
+        elif name not in _hashes and name in lazy and name not in _preexisting:
+            # Imported on demand since the last rerun, i.e. from current source
+            _hashes[name] = _source_hash(module)
+            continue
+        else:
+            digest = _source_hash(module)
+            if not cascade and _hashes.get(name) == digest:
+                _stats["skips"] += 1
+                saved += _costs.get(name, 0.0)
+                continue
+            if name in _hashes:
+                _drop_bytecode(module)
+                importlib.invalidate_caches()
+            module = importlib.reload(module)
+        _costs[name] = time.perf_counter() - t0
+        _hashes[name] = _source_hash(module)
+        _stats["reloads"] += 1
+        loaded.append(name)
+        cascade = True
+
+    _stats["saved_seconds"] += saved
+    if loaded:
+        log.info("Reloaded %s", ", ".join(loaded))
+    log.info("Skipped %d unchanged module(s), saved %.1f ms this rerun (%.1f ms total)",
+             _stats["skips"] - skips_before, saved * 1000, _stats["saved_seconds"] * 1000)
+    return loaded
+
+
+def stats() -> dict:
+    """Cumulative counters since the process started."""
+    return dict(_stats)
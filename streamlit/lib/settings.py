@@ -0,0 +1,24 @@
+"""
+Runtime settings for the Streamlit variant.
+
+A setting is looked up as an environment variable first
+(``FEEDBACK_BACKEND``), then in the matching ``st.secrets`` section
+(``[feedback] backend = "..."``), then falls back to the default.
+"""
+import os
+import streamlit as st
+
+
+def get(section: str, key: str, default=None):
+    """Return a setting, cast to the type of ``default`` when one is given."""
+    raw = os.environ.get(f"{section}_{key}".upper())
+    if raw is None:
+        try:
+            return st.secrets[section][key]
+        except (KeyError, FileNotFoundError):
+            return default
+    if isinstance(default, bool):
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(default, (int, float)):
+        return type(default)(raw)
+    return raw
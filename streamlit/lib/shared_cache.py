@@ -0,0 +1,159 @@
+"""
+Cross-process cache for the feedback snapshot.
+
+Several Streamlit processes (replicas behind a load balancer on one host
+or a shared volume) use one SQLite file instead of each polling the
+Google Sheet:
+
+  - ``cache_data`` holds the last synced table as an Arrow IPC blob
+  - ``cache_meta`` holds a version counter, the sync time, a dirty
+    counter and a refresh lease
+
+Replicas compare the version (a one-row read) every poll interval and
+load the blob only when it changed.  When the cached table is older than
+the TTL or marked dirty by a write, the first replica to take the lease
+refreshes it from the backend and publishes a new version; the others
+keep serving their copy meanwhile.  So the Sheet is read once per TTL
+(or write) in total, not once per replica.
+
+Do not put the file on NFS or similar: SQLite locking is unreliable there.
+"""
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+LEASE_SECONDS = 60.0  # a refresher that died mid-sync is replaced after this
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_meta (
+    name            TEXT PRIMARY KEY,
+    version         INTEGER NOT NULL DEFAULT 0,
+    synced_at       REAL NOT NULL DEFAULT 0,
+    full_synced_at  REAL NOT NULL DEFAULT 0,
+    dirty_seq       INTEGER NOT NULL DEFAULT 0,
+    synced_seq      INTEGER NOT NULL DEFAULT 0,
+    lease_owner     TEXT,
+    lease_until     REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS cache_data (
+    name     TEXT PRIMARY KEY,
+    version  INTEGER NOT NULL,
+    data     BLOB NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class CacheState:
+    version: int           # 0 = nothing published yet
+    synced_at: float       # wall clock of the last publish
+    full_synced_at: float  # wall clock of the last full reload
+    dirty_seq: int         # bumped by every write on any replica
+
+    dirty: bool            # a write happened after the last publish
+
+
+class SharedCache:
+    """Versioned table + refresh lease in a SQLite file (one per cache name)."""
+
+    def __init__(self, path, name: str = "feedback"):
+        self.path = Path(path)
+        self.name = name
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("INSERT OR IGNORE INTO cache_meta (name) VALUES (?)", (name,))
+
+    def state(self) -> CacheState:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, synced_at, full_synced_at, dirty_seq, synced_seq "
+                "FROM cache_meta WHERE name = ?", (self.name,)).fetchone()
+        version, synced_at, full_synced_at, dirty_seq, synced_seq = row
+        return CacheState(version, synced_at, full_synced_at, dirty_seq, dirty_seq > synced_seq)
+
+    def mark_dirty(self):
+        """Tell the refresher that the backend changed (called after every write)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cache_meta SET dirty_seq = dirty_seq + 1 WHERE name = ?", (self.name,))
+
+    def try_lease(self, seconds: float = LEASE_SECONDS) -> bool:
+        """Become the refresher for ``seconds`` unless another process holds the lease."""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE cache_meta SET lease_owner = ?, lease_until = ? "
+                "WHERE name = ? AND (lease_owner IS NULL OR lease_owner = ? OR lease_until < ?)",
+                (self.owner, now + seconds, self.name, self.owner, now))
+            return cur.rowcount == 1
+
+    def release_lease(self):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cache_meta SET lease_owner = NULL, lease_until = 0 "
+                "WHERE name = ? AND lease_owner = ?", (self.name, self.owner))
+
+    def publish(self, df: pd.DataFrame, seen_dirty_seq: int, full: bool) -> int:
+        """Store ``df`` as the next version; writes after ``seen_dirty_seq`` stay dirty."""
+        blob = _to_ipc(df)
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (version,) = self._conn.execute(
+                    "SELECT version FROM cache_meta WHERE name = ?", (self.name,)).fetchone()
+                version += 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_data (name, version, data) VALUES (?, ?, ?)",
+                    (self.name, version, blob))
+                self._conn.execute(
+                    "UPDATE cache_meta SET version = ?, synced_at = ?, synced_seq = ?, "
+                    "full_synced_at = CASE WHEN ? THEN ? ELSE full_synced_at END WHERE name = ?",
+                    (version, now, seen_dirty_seq, full, now, self.name))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return version
+
+    def touch(self, seen_dirty_seq: int):
+        """Record a refresh that found no changes; the version stays the same."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cache_meta SET synced_at = ?, synced_seq = ? WHERE name = ?",
+                (time.time(), seen_dirty_seq, self.name))
+
+    def load(self):
+        """Return (version, full_synced_at, DataFrame) of the published table.
+
+        (0, 0.0, None) while nothing has been published yet.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT d.version, m.full_synced_at, d.data FROM cache_data d "
+                "JOIN cache_meta m ON m.name = d.name WHERE d.name = ?", (self.name,)).fetchone()
+        if row is None:
+            return 0, 0.0, None
+        return row[0], row[1], pa.ipc.open_stream(row[2]).read_all().to_pandas()
+
+
+def _to_ipc(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,146 @@
+"""
+Quota-aware Google Sheets client used by the "sheets" feedback backend.
+
+- authenticates once and reuses the gspread HTTP session
+- opens the spreadsheet/worksheet once and caches the handle
+- throttles calls with a token bucket sized to the per-minute quota
+- retries 429/5xx and connection errors with exponential backoff
+"""
+import collections
+import logging
+import random
+import threading
+import time
+
+import gspread
+import requests
+from google.oauth2.service_account import Credentials
+
+from lib import perf
+
+log = logging.getLogger(__name__)
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def status_of(e) -> int:
+    """HTTP status of a failed call, or None (e.g. connection errors)."""
+    return getattr(getattr(e, "response", None), "status_code", None)
+
+
+def is_transient(e) -> bool:
+    """True for errors a later retry can fix: quota, 5xx, connection problems."""
+    if isinstance(e, gspread.exceptions.APIError):
+        return status_of(e) in RETRY_STATUS
+    return isinstance(e, (requests.ConnectionError, requests.Timeout))
+
+
+class TokenBucket:
+    """Allow ``rate`` calls per second on average, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class SheetsClient:
+    """Throttled access to one worksheet of one spreadsheet."""
+
+    def __init__(self, credentials_info, spreadsheet_url: str, worksheet: str = "feedback",
+                 requests_per_minute: int = 60, max_retries: int = 5, max_backoff: float = 32.0):
+        self._credentials_info = dict(credentials_info)
+        self._url = spreadsheet_url
+        self._worksheet_name = worksheet
+        self._requests_per_minute = requests_per_minute
+        self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        self._bucket = TokenBucket(requests_per_minute / 60.0, capacity=max(1, requests_per_minute // 6))
+        self._lock = threading.Lock()       # guards the call log and counters
+        self._open_lock = threading.Lock()  # guards opening the worksheet
+        self._gc = None
+        self._ws = None
+        self._calls = collections.deque()  # monotonic timestamps of recent API calls
+        self.retries = 0
+        self.throttled_seconds = 0.0
+
+    def worksheet(self):
+        """Return the cached worksheet handle (opened on first use)."""
+        with self._open_lock:
+            if self._ws is None:
+                if self._gc is None:
+                    creds = Credentials.from_service_account_info(
+                        self._credentials_info, scopes=SCOPES,
+                    )
+                    self._gc = gspread.authorize(creds)
+                spreadsheet = self.call(self._gc.open_by_url, self._url)
+                self._ws = self.call(spreadsheet.worksheet, self._worksheet_name)
+            return self._ws
+
+    def call(self, fn, *args, **kwargs):
+        """Run one API call under the quota, retrying transient failures."""
+        attempt = 0
+        while True:
+            self._record_call(throttled=self._bucket.acquire())
+            perf.count("sheets.api_calls")
+            try:
+                with perf.timer(f"sheets.{getattr(fn, '__name__', 'call')}") as t:
+                    result = fn(*args, **kwargs)
+                    t.bytes = perf.approx_bytes(result) if isinstance(result, (list, dict)) else 0
+                return result
+            except (gspread.exceptions.APIError, requests.ConnectionError, requests.Timeout) as e:
+                status = status_of(e)
+                if not is_transient(e) or attempt >= self._max_retries:
+                    raise
+                delay = min(self._max_backoff, 2 ** attempt) + random.uniform(0, 1)
+                log.warning("Sheets call failed (%s), retry %d in %.1fs",
+                            status or type(e).__name__, attempt + 1, delay)
+                with self._lock:
+                    self.retries += 1
+                perf.count("sheets.retries")
+                attempt += 1
+                time.sleep(delay)
+
+    def quota(self) -> dict:
+        """Calls made in the last 60 seconds vs. the configured limit."""
+        with self._lock:
+            self._trim_calls(time.monotonic())
+            return {
+                "used_last_minute": len(self._calls),
+                "limit_per_minute": self._requests_per_minute,
+                "retries": self.retries,
+                "throttled_seconds": round(self.throttled_seconds, 2),
+            }
+
+    def _record_call(self, throttled: float):
+        now = time.monotonic()
+        with self._lock:
+            self.throttled_seconds += throttled
+            self._calls.append(now)
+            self._trim_calls(now)
+
+    def _trim_calls(self, now: float):
+        while self._calls and now - self._calls[0] > 60:
+            self._calls.popleft()
@@ -1,7 +1,17 @@
 """
 Theme constants matching the React T object for visual parity.
-Includes HTML KPI cards and premium CSS styling.
+Includes HTML KPI cards, HTML data tables and premium CSS styling.
 """
+import html
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from lib import perf
 
 # ── Colors ────────────────────────────────────────────────────
 BG = "#f5f6f8"
@@ -48,7 +58,6 @@ def render_kpis(cols, kpis_data):
 
     kpis_data: list of dicts with keys: label, value, sub, trend, trend_color
     """
-    import streamlit as st
     for col, kpi in zip(cols, kpis_data):
         col.markdown(
             kpi_card(
@@ -73,6 +82,101 @@ def section_card(title: str, subtitle: str = "") -> str:
     """
 
 
+# ── HTML Data Table ───────────────────────────────────────────
+
+TABLE_PAGE_SIZE = 50
+
+
+@dataclass(frozen=True)
+class TableColumn:
+    """One column of an HTML data table.
+
+    fmt:  whole-column formatter (Series → Series of str); default escapes str()
+    cls:  static CSS classes for every cell, e.g. "num muted"
+    tone: whole-column classifier (Series → array of extra classes), e.g. pos/warn/neg
+    """
+    key: str
+    label: str
+    fmt: Optional[Callable] = None
+    cls: str = ""
+    tone: Optional[Callable] = None
+
+
+def fmt_number(prefix: str = "", suffix: str = "", decimals: int = 0) -> Callable:
+    """Column formatter with thousands separators, e.g. fmt_number("€")."""
+    pattern = f"{prefix}{{:,.{decimals}f}}{suffix}"
+    return lambda s: s.map(pattern.format)
+
+
+def tone_by_threshold(good: float, warn: float) -> Callable:
+    """Classify values as pos (≥ good), warn (≥ warn) or neg."""
+    return lambda s: np.select([s >= good, s >= warn], ["pos", "warn"], "neg")
+
+
+def table_html(df: pd.DataFrame, columns: list) -> str:
+    """Render ``df`` as a styled HTML table, formatting column by column."""
+    head = "".join(
+        f'<th class="{c.cls}">{html.escape(c.label)}</th>' for c in columns
+    )
+    body = ""
+    if not df.empty:
+        rows = pd.Series("<tr>", index=df.index, dtype=object)
+        for c in columns:
+            values = df[c.key]
+            text = c.fmt(values) if c.fmt else values.astype(str).map(html.escape)
+            if c.tone:
+                classes = (c.cls + " " + pd.Series(c.tone(values), index=df.index)).str.strip()
+                rows = rows + '<td class="' + classes + '">' + text + "</td>"
+            else:
+                rows = rows + f'<td class="{c.cls}">' + text + "</td>"
+        body = "".join(rows + "</tr>")
+    return (
+        f'<div class="data-table-wrap"><table class="data-table">'
+        f'<thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></div>'
+    )
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _table_page_html(table_id: str, data_version: str, page: int, page_size: int,
+                     _df: pd.DataFrame, _columns: list) -> str:
+    perf.cache_miss("table_html")
+    start = (page - 1) * page_size
+    return table_html(_df.iloc[start:start + page_size], _columns)
+
+
+def clear_table_cache():
+    """Drop cached table HTML; the key does not cover column specs or formatters,
+    so app.py calls this after a module reload."""
+    _table_page_html.clear()
+
+
+def render_table(table_id: str, df: pd.DataFrame, columns: list, data_version: str,
+                 page_size: int = TABLE_PAGE_SIZE):
+    """Render a paged HTML table; each page's HTML is cached per data version.
+
+    ``df`` must be fully determined by (table_id, data_version) — it is not
+    part of the cache key.  Tables longer than ``page_size`` rows get a page
+    selector, so the browser only ever receives one page of rows.
+    """
+    pages = max(1, math.ceil(len(df) / page_size))
+    table_slot = st.empty()
+    page = 1
+    if pages > 1:
+        col_page, col_info = st.columns([1, 2])
+        page = col_page.number_input(
+            "Seite", min_value=1, max_value=pages, value=1, step=1,
+            key=f"{table_id}_page", label_visibility="collapsed",
+        )
+        first = (page - 1) * page_size + 1
+        last = min(page * page_size, len(df))
+        col_info.caption(f"Zeilen {first}–{last} von {len(df)} · Seite {page}/{pages}")
+    perf.cache_lookup("table_html")
+    table_slot.markdown(
+        _table_page_html(table_id, data_version, page, page_size, df, columns),
+        unsafe_allow_html=True,
+    )
+
+
 # ── Plotly Layout Template ────────────────────────────────────
 
 def plotly_layout(**kwargs):
@@ -249,6 +353,49 @@ CUSTOM_CSS = """
         margin-top: 4px;
     }
 
+    /* ── HTML Data Tables ─────────────────────────────── */
+    .data-table-wrap {
+        overflow-x: auto;
+        overflow-y: auto;
+        max-height: 500px;
+        font-family: 'DM Sans', sans-serif;
+        font-size: 13px;
+    }
+    .data-table {
+        width: 100%;
+        border-collapse: collapse;
+    }
+    .data-table thead tr {
+        border-bottom: 2px solid #e2e5ea;
+        position: sticky;
+        top: 0;
+        background: #ffffff;
+    }
+    .data-table th {
+        padding: 8px 8px;
+        text-align: left;
+        font-size: 10px;
+        font-weight: 700;
+        text-transform: uppercase;
+        color: #6b7280;
+        font-family: 'JetBrains Mono', mono;
+        letter-spacing: 0.5px;
+    }
+    .data-table td {
+        padding: 6px 8px;
+    }
+    .data-table .num {
+        text-align: right;
+        font-family: 'JetBrains Mono', mono;
+    }
+    .data-table td.num { font-size: 12px; }
+    .data-table td.label { font-weight: 500; }
+    .data-table td.muted { color: #6b7280; }
+    .data-table td.strong { font-weight: 700; }
+    .data-table td.pos { color: #059669; }
+    .data-table td.warn { color: #d97706; }
+    .data-table td.neg { color: #dc2626; }
+
     /* ── Override st.metric (fallback) ───────────────── */
     div[data-testid="stMetric"] {
         background: white;
@@ -2,13 +2,15 @@
 import streamlit as st
 import plotly.graph_objects as go
 
-from lib.mock_data import df_monthly, kpis, short_month
+from lib import mock_data
+from lib.figure_cache import cached_figure
 from lib.theme import ACCENT1, TEXT_DIM, GREEN, RED, plotly_layout, render_kpis
 from lib.feedback_ui import section_with_feedback, feedback_section
 
 
 def show():
     st.markdown("## 📊 Executive Summary")
+    kpis = mock_data.kpis
 
     # ── KPIs (HTML cards) ─────────────────────────────────────
     rev_delta = (kpis["cumulative_net_revenue"] / 600_000 - 1) * 100
@@ -34,58 +36,65 @@ def show():
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
 
     # ── Charts ────────────────────────────────────────────────
-    df = df_monthly.copy()
-    df["month_label"] = df["month"].apply(short_month)
-
     col1, col2 = st.columns(2)
 
     with col1:
         section_with_feedback("exec-summary", "trx-chart", "TRx Entwicklung", "Ist vs. Plan — monatliche Verordnungen")
-
-        fig = go.Figure()
-
-        # Forecast corridor (upper/lower)
-        if "trx_upper" in df.columns and "trx_lower" in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df["month_label"], y=df["trx_upper"],
-                mode="lines", line=dict(width=0), showlegend=False,
-                name="Upper", hoverinfo="skip",
-            ))
-            fig.add_trace(go.Scatter(
-                x=df["month_label"], y=df["trx_lower"],
-                mode="lines", line=dict(width=0), showlegend=True,
-                fill="tonexty", fillcolor="rgba(37,99,235,0.12)",
-                name="Korridor",
-            ))
-
-        # Actual line
-        fig.add_trace(go.Scatter(
-            x=df["month_label"], y=df["trx"], mode="lines+markers",
-            name="Ist", line=dict(color=ACCENT1, width=2.5),
-            marker=dict(size=7, color=ACCENT1),
-        ))
-        # Plan line
-        fig.add_trace(go.Scatter(
-            x=df["month_label"], y=df["trx_plan"], mode="lines",
-            name="Plan", line=dict(color=TEXT_DIM, width=1.5, dash="dash"),
-        ))
-        fig.update_layout(**plotly_layout(height=280))
+        fig = cached_figure("exec-summary/trx-chart", _trx_figure)
         st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
     with col2:
         section_with_feedback("exec-summary", "revenue-chart", "Net Revenue", "Monatlich Ist vs. Plan (€)")
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=df["month_label"], y=df["net_revenue"], name="Ist",
-            marker_color=ACCENT1, marker_cornerradius=4,
-        ))
-        fig.add_trace(go.Bar(
-            x=df["month_label"], y=df["net_plan"], name="Plan",
-            marker_color=TEXT_DIM, opacity=0.3, marker_cornerradius=4,
-        ))
-        fig.update_layout(**plotly_layout(height=280, barmode="group"))
+        fig = cached_figure("exec-summary/revenue-chart", _revenue_figure)
         st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
     # ── Feedback ──────────────────────────────────────────────
     feedback_section("exec-summary")
+
+
+def _trx_figure():
+    df = mock_data.df_monthly
+    fig = go.Figure()
+
+    # Forecast corridor (upper/lower)
+    if "trx_upper" in df.columns and "trx_lower" in df.columns:
+        fig.add_trace(go.Scatter(
+            x=df["month_label"], y=df["trx_upper"],
+            mode="lines", line=dict(width=0), showlegend=False,
+            name="Upper", hoverinfo="skip",
+        ))
+        fig.add_trace(go.Scatter(
+            x=df["month_label"], y=df["trx_lower"],
+            mode="lines", line=dict(width=0), showlegend=True,
+            fill="tonexty", fillcolor="rgba(37,99,235,0.12)",
+            name="Korridor",
+        ))
+
+    # Actual line
+    fig.add_trace(go.Scatter(
+        x=df["month_label"], y=df["trx"], mode="lines+markers",
+        name="Ist", line=dict(color=ACCENT1, width=2.5),
+        marker=dict(size=7, color=ACCENT1),
+    ))
+    # Plan line
+    fig.add_trace(go.Scatter(
+        x=df["month_label"], y=df["trx_plan"], mode="lines",
+        name="Plan", line=dict(color=TEXT_DIM, width=1.5, dash="dash"),
+    ))
+    fig.update_layout(**plotly_layout(height=280))
+    return fig
+
+
+def _revenue_figure():
+    df = mock_data.df_monthly
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df["month_label"], y=df["net_revenue"], name="Ist",
+        marker_color=ACCENT1, marker_cornerradius=4,
+    ))
+    fig.add_trace(go.Bar(
+        x=df["month_label"], y=df["net_plan"], name="Plan",
+        marker_color=TEXT_DIM, opacity=0.3, marker_cornerradius=4,
+    ))
+    fig.update_layout(**plotly_layout(height=280, barmode="group"))
+    return fig
@@ -1,13 +1,51 @@
 """Feedback Overview — Admin page with filters, styled table, and export."""
+import functools
+import math
+
+import pandas as pd
 import streamlit as st
-from io import BytesIO
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
-from lib import feedback_db
+from lib import feedback_db, feedback_export, perf, settings
 from lib.theme import GREEN, YELLOW, RED, render_kpis
 
+PAGE_SIZES = [10, 25, 50, 100]
+
+# Label → (sort columns, ascending per column)
+SORT_OPTIONS = {
+    "Neueste zuerst": (["created_at"], [False]),
+    "Älteste zuerst": (["created_at"], [True]),
+    "Runde, Seite": (["round", "page_id", "created_at"], [True, True, False]),
+    "Offene zuerst": (["status", "created_at"], [True, False]),
+    "Bewertung ↓": (["rating", "created_at"], [False, False]),
+    "Bewertung ↑": (["rating", "created_at"], [True, False]),
+}
+
+# Only offered while searching
+RELEVANCE = "Relevanz"
+RELEVANCE_SORT = (["score", "created_at"], [False, False])
+
+# Label → look-back (None = no window, "round" = since the round's first entry)
+PERIODS = {
+    "Gesamter Zeitraum": None,
+    "Letzte 24 h": pd.Timedelta(hours=24),
+    "Letzte 7 Tage": pd.Timedelta(days=7),
+    "Seit Rundenstart": "round",
+}
+
+# Session key: {id: status} changed in the entry list since the last full run
+_STATUS_OVERRIDES = "_admin_status_overrides"
+# Session key: filters, sort and page size the selected page belongs to
+_PAGE_VIEW = "_admin_page_view"
+
+EDITOR_COLUMNS = ["id", "status", "round", "page_id", "element_id", "author",
+                  "rating", "comment", "created_at"]
+
 
 def show():
     st.markdown("## 💬 Feedback-Übersicht")
+    # A full run reads fresh statuses from the snapshot
+    st.session_state[_STATUS_OVERRIDES] = {}
 
     df_all = feedback_db.export_dataframe()
 
@@ -54,76 +92,233 @@ def show():
 
     status_filter = fc4.selectbox("Status", ["Alle", "Offen", "Erledigt"])
 
-    # Apply filters
-    df = df_all.copy()
-    if round_filter != "Alle":
-        df = df[df["round"] == int(round_filter.split(" ")[1])]
-    if page_filter != "Alle":
-        df = df[df["page_id"] == page_filter]
-    if element_filter == "Nur Seitenkommentare":
-        df = df[df["element_id"].isna()]
-    elif element_filter != "Alle":
-        df = df[df["element_id"] == element_filter]
-    if status_filter == "Offen":
-        df = df[df["status"] == "open"]
-    elif status_filter == "Erledigt":
-        df = df[df["status"] == "resolved"]
+    qc1, qc2 = st.columns([4, 2])
+    query = qc1.text_input("🔎 Suche in Kommentaren und Autoren", key="admin_search",
+                           placeholder="z. B. Legende, Farben, Größe …").strip()
+    period = qc2.selectbox("Zeitraum", list(PERIODS), key="admin_period")
+    since = _period_start(period, None if round_filter == "Alle" else int(round_filter.split(" ")[1]))
+
+    filters = (round_filter, page_filter, element_filter, status_filter, query, since)
+    df, scores = _filtered(*filters)
 
     with fc5:
         st.write("")
-        exp1, exp2 = st.columns(2)
-        csv = df.to_csv(index=False).encode("utf-8")
-        exp1.download_button("📥 CSV", csv, "feedback.csv", "text/csv", use_container_width=True)
-        buffer = BytesIO()
-        df.to_excel(buffer, index=False, engine="openpyxl")
-        exp2.download_button("📥 Excel", buffer.getvalue(), "feedback.xlsx",
-                             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                             use_container_width=True)
+        # Files are generated only when a button is clicked, then cached per
+        # filter set and data version
+        for col, (fmt, (label, file_name, mime)) in zip(
+                st.columns(len(feedback_export.FORMATS)), feedback_export.FORMATS.items()):
+            col.download_button(
+                label, functools.partial(_export, fmt, filters),
+                file_name, mime, use_container_width=True, key=f"admin_export_{fmt}",
+            )
 
     st.markdown("</div>", unsafe_allow_html=True)
 
-    # ── Feedback entries (HTML styled) ────────────────────────
-    st.markdown(f"""<div style="font-size:12px; font-weight:600; color:#6b7280;
+    # ── Feedback entries ──────────────────────────────────────
+    _entries(df, scores, query, (round_filter, page_filter, element_filter, status_filter, period))
+
+
+@st.fragment
+def _entries(df, scores: dict, query: str, filters: tuple = ()):
+    """Entry list: status changes, sorting and paging rerun only this part.
+
+    ``df`` is the filtered set of the last full run; status changes made
+    here since then are applied from the session overrides.
+    """
+    with perf.timer("fragment.admin_entries"):
+        _render_entries(df, scores, query, filters)
+
+
+def _render_entries(df, scores: dict, query: str, filters: tuple):
+    overrides = st.session_state.get(_STATUS_OVERRIDES)
+    if overrides:
+        changed = df["id"].isin(overrides.keys())
+        if changed.any():
+            status = df["status"].astype(object)
+            status[changed] = df.loc[changed, "id"].map(overrides)
+            df = df.assign(status=status)
+
+    col_count, col_bulk = st.columns([4, 2])
+    col_count.markdown(f"""<div style="font-size:12px; font-weight:600; color:#6b7280;
         text-transform:uppercase; margin:16px 0 8px 0; letter-spacing:0.5px">
         {len(df)} Einträge
     </div>""", unsafe_allow_html=True)
 
-    for _, row in df.iterrows():
-        stars = "★" * int(row["rating"]) + "☆" * (5 - int(row["rating"]))
-        is_resolved = row["status"] == "resolved"
-        css_class = "feedback-item resolved" if is_resolved else "feedback-item"
-        time_str = str(row["created_at"])[:16].replace("T", " ")
-
-        # Element badge
-        element_badge = ""
-        if row.get("element_id") and str(row["element_id"]) != "nan":
-            element_badge = f"""<span style="font-family:'JetBrains Mono',mono; font-size:10px; font-weight:600;
-                background:#06b6d412; color:#06b6d4; padding:2px 8px; border-radius:4px;">🔗 {row['element_id']}</span>"""
-        else:
-            element_badge = """<span style="font-size:10px; color:#9ca3af;">📄 Seite</span>"""
-
-        st.markdown(f"""
-        <div class="{css_class}">
-            <div style="flex:1">
-                <div style="display:flex; align-items:center; gap:8px; flex-wrap:wrap; margin-bottom:4px;">
-                    <span style="font-family:'JetBrains Mono',mono; font-size:11px; font-weight:600;
-                        background:#2563eb12; color:#2563eb; padding:2px 8px; border-radius:4px;">Runde {row['round']}</span>
-                    <span style="font-size:11px; color:#6b7280; background:#f0f2f5; padding:2px 8px; border-radius:4px;">📄 {row['page_id']}</span>
-                    {element_badge}
-                    <span class="feedback-author">{row['author']}</span>
-                    <span class="feedback-stars">{stars}</span>
-                </div>
-                <div class="feedback-comment">{row['comment']}</div>
-                <div class="feedback-time">{time_str}</div>
+    # Bulk action: resolve the whole filtered set in one request
+    open_ids = df.loc[df["status"] == "open", "id"].tolist()
+    if open_ids:
+        col_bulk.button(f"✅ {len(open_ids)} offene erledigen", key="admin_resolve_all",
+                        use_container_width=True, on_click=_set_statuses,
+                        args=(dict.fromkeys(open_ids, "resolved"),))
+
+    lc1, lc2, lc3 = st.columns([2, 1, 1])
+    if query:
+        sort_label = lc1.selectbox("Sortierung", [RELEVANCE] + list(SORT_OPTIONS), key="admin_sort_search")
+    else:
+        sort_label = lc1.selectbox("Sortierung", list(SORT_OPTIONS), key="admin_sort")
+    default_size = settings.get("feedback", "admin_page_size", 25)
+    page_size = lc2.selectbox("Pro Seite", PAGE_SIZES, key="admin_page_size",
+                              index=PAGE_SIZES.index(default_size) if default_size in PAGE_SIZES else 1)
+    view = lc3.radio("Ansicht", ["Karten", "Kompakt"], horizontal=True, key="admin_view")
+
+    # Only the current page is sorted into view and rendered
+    if sort_label == RELEVANCE:
+        df = df.assign(score=df["id"].map(scores).astype(float))
+        by, ascending = RELEVANCE_SORT
+    else:
+        by, ascending = SORT_OPTIONS[sort_label]
+    df = df.sort_values(by, ascending=ascending, kind="stable", na_position="last")
+    df_page = _page_slice(df, page_size, (filters, query, sort_label, page_size))
+
+    if view == "Kompakt":
+        _render_editor(df_page)
+    else:
+        for _, row in df_page.iterrows():
+            _render_card(row)
+
+
+def _filtered(round_filter: str, page_filter: str, element_filter: str, status_filter: str,
+              query: str, since, snapshot=None):
+    """Entries matching the filter selection (export order) + search scores."""
+    # Bitset index, one take for any combination
+    df = feedback_db.get_feedback(
+        page_id=None if page_filter == "Alle" else page_filter,
+        round_num=None if round_filter == "Alle" else int(round_filter.split(" ")[1]),
+        status={"Offen": "open", "Erledigt": "resolved"}.get(status_filter),
+        element_id={"Alle": "__unset__", "Nur Seitenkommentare": None}.get(element_filter, element_filter),
+        order="export",
+        since=since,
+        snapshot=snapshot,
+    )
+    scores = {}
+    if query:
+        # Inverted index, ranked; no substring scan over the table
+        scores = feedback_db.search_feedback(query, snapshot=snapshot)
+        df = df[df["id"].isin(scores.keys())].reset_index(drop=True)
+    return df, scores
+
+
+def _export(fmt: str, filters: tuple) -> bytes:
+    """Download callable: filters the snapshot that is current at click time,
+    so status changes made in the entry list since the last full run are in."""
+    # One snapshot for rows and cache key, so a concurrent write can't mix them
+    snapshot = feedback_db.get_snapshot()
+    df, _ = _filtered(*filters, snapshot=snapshot)
+    return feedback_export.export_bytes(fmt, filters, snapshot.version, df)
+
+
+def _period_start(period: str, round_num: int):
+    """Start of the time window (naive UTC, like created_at), or None."""
+    look_back = PERIODS[period]
+    if look_back is None:
+        return None
+    if look_back == "round":
+        # Round filter, else the current round
+        return feedback_db.get_round_start(round_num or feedback_db.get_max_round())
+    # Whole minutes, so the export cache key is stable across reruns
+    return pd.Timestamp.now("UTC").tz_localize(None).floor("min") - look_back
+
+
+def _page_slice(df, page_size: int, view: tuple):
+    """Page selector + the rows of the selected page.
+
+    Back to page 1 whenever ``view`` (filters, search, sort, page size) changes.
+    """
+    pages = max(1, math.ceil(len(df) / page_size))
+    if st.session_state.get(_PAGE_VIEW) != view:
+        st.session_state[_PAGE_VIEW] = view
+        st.session_state["admin_page"] = 1
+    elif st.session_state.get("admin_page", 1) > pages:
+        # Same view but fewer entries (e.g. resolved ones left the "Offen" filter)
+        st.session_state["admin_page"] = pages
+    if pages > 1:
+        pc1, pc2 = st.columns([1, 5])
+        page = pc1.number_input("Seite", min_value=1, max_value=pages, step=1,
+                                key="admin_page", label_visibility="collapsed")
+        pc2.caption(f"Seite {page} von {pages}")
+    else:
+        page = 1
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+def _render_editor(df_page):
+    """Compact rows in one data editor; status edits are saved in one batch."""
+    original = df_page[EDITOR_COLUMNS].reset_index(drop=True)
+    original["status"] = original["status"].astype(str)
+    edited = st.data_editor(
+        original,
+        hide_index=True,
+        use_container_width=True,
+        disabled=[c for c in EDITOR_COLUMNS if c != "status"],
+        column_config={
+            "id": None,
+            "status": st.column_config.SelectboxColumn(
+                "Status", options=["open", "resolved"], required=True),
+            "round": st.column_config.NumberColumn("Runde", width="small"),
+            "page_id": "Seite",
+            "element_id": "Element",
+            "author": "Autor",
+            "rating": st.column_config.NumberColumn("★", width="small"),
+            "comment": st.column_config.TextColumn("Kommentar", width="large"),
+            "created_at": st.column_config.DatetimeColumn("Zeit", format="YYYY-MM-DD HH:mm"),
+        },
+    )
+    changed = edited["status"] != original["status"]
+    if changed.any() and st.button(f"💾 {int(changed.sum())} Statusänderungen speichern",
+                                   key="admin_save_statuses", type="primary"):
+        # Edits are only known after the editor was drawn: write, then redraw the list
+        _set_statuses(dict(zip(edited.loc[changed, "id"], edited.loc[changed, "status"])))
+        _rerun_entries()
+
+
+def _set_statuses(changes: dict):
+    """Write status changes and show them in the list before the next full run."""
+    feedback_db.set_statuses(changes)
+    st.session_state.setdefault(_STATUS_OVERRIDES, {}).update(changes)
+
+
+def _rerun_entries():
+    # scope="fragment" is only allowed while the fragment reruns on its own
+    ctx = get_script_run_ctx()
+    st.rerun(scope="fragment" if ctx and ctx.fragment_ids_this_run else "app")
+
+
+def _render_card(row):
+    stars = "★" * int(row["rating"]) + "☆" * (5 - int(row["rating"]))
+    is_resolved = row["status"] == "resolved"
+    css_class = "feedback-item resolved" if is_resolved else "feedback-item"
+    time_str = str(row["created_at"])[:16].replace("T", " ")
+
+    # Element badge
+    element_badge = ""
+    if row.get("element_id") and str(row["element_id"]) != "nan":
+        element_badge = f"""<span style="font-family:'JetBrains Mono',mono; font-size:10px; font-weight:600;
+            background:#06b6d412; color:#06b6d4; padding:2px 8px; border-radius:4px;">🔗 {row['element_id']}</span>"""
+    else:
+        element_badge = """<span style="font-size:10px; color:#9ca3af;">📄 Seite</span>"""
+
+    st.markdown(f"""
+    <div class="{css_class}">
+        <div style="flex:1">
+            <div style="display:flex; align-items:center; gap:8px; flex-wrap:wrap; margin-bottom:4px;">
+                <span style="font-family:'JetBrains Mono',mono; font-size:11px; font-weight:600;
+                    background:#2563eb12; color:#2563eb; padding:2px 8px; border-radius:4px;">Runde {row['round']}</span>
+                <span style="font-size:11px; color:#6b7280; background:#f0f2f5; padding:2px 8px; border-radius:4px;">📄 {row['page_id']}</span>
+                {element_badge}
+                <span class="feedback-author">{row['author']}</span>
+                <span class="feedback-stars">{stars}</span>
             </div>
+            <div class="feedback-comment">{row['comment']}</div>
+            <div class="feedback-time">{time_str}</div>
         </div>
-        """, unsafe_allow_html=True)
-
-        # Toggle button
-        col_spacer, col_btn = st.columns([6, 1])
-        with col_btn:
-            btn_label = "✅ Erledigt" if is_resolved else "🔲 Offen"
-            if st.button(btn_label, key=f"admin_toggle_{row['id']}", use_container_width=True):
-                new_status = "resolved" if row["status"] == "open" else "open"
-                feedback_db.update_status(int(row["id"]), new_status)
-                st.rerun()
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Toggle button
+    col_spacer, col_btn = st.columns([6, 1])
+    with col_btn:
+        btn_label = "✅ Erledigt" if is_resolved else "🔲 Offen"
+        new_status = "resolved" if row["status"] == "open" else "open"
+        st.button(btn_label, key=f"admin_toggle_{row['id']}", use_container_width=True,
+                  on_click=_set_statuses, args=({row["id"]: new_status},))
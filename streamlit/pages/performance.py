@@ -0,0 +1,136 @@
+"""Performance — Admin page with latency percentiles, cache hit ratios and JSON export."""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from lib import feedback_db, perf, reloader
+from lib.feedback_backends import sheets_quota
+from lib.theme import (GREEN, RED, YELLOW, TableColumn, fmt_number, render_kpis,
+                       render_table, tone_by_threshold)
+
+OPERATION_COLUMNS = [
+    TableColumn("operation", "Operation", cls="label"),
+    TableColumn("count", "Aufrufe", fmt=fmt_number(), cls="num"),
+    TableColumn("errors", "Fehler", fmt=fmt_number(), cls="num muted"),
+    TableColumn("p50_ms", "p50 ms", fmt=fmt_number(decimals=1), cls="num"),
+    TableColumn("p95_ms", "p95 ms", fmt=fmt_number(decimals=1), cls="num strong"),
+    TableColumn("p99_ms", "p99 ms", fmt=fmt_number(decimals=1), cls="num"),
+    TableColumn("max_ms", "Max ms", fmt=fmt_number(decimals=1), cls="num muted"),
+    TableColumn("total_ms", "Summe ms", fmt=fmt_number(), cls="num muted"),
+    TableColumn("bytes", "Bytes", fmt=fmt_number(), cls="num"),
+]
+
+CACHE_COLUMNS = [
+    TableColumn("cache", "Cache", cls="label"),
+    TableColumn("lookups", "Zugriffe", fmt=fmt_number(), cls="num"),
+    TableColumn("hits", "Treffer", fmt=fmt_number(), cls="num"),
+    TableColumn("misses", "Fehlzugriffe", fmt=fmt_number(), cls="num muted"),
+    TableColumn("hit_ratio", "Trefferquote",
+                fmt=lambda s: s.map(lambda v: "–" if pd.isna(v) else f"{v:.0%}"), cls="num strong",
+                tone=lambda s: tone_by_threshold(0.9, 0.5)(s.fillna(1))),
+]
+
+COUNTER_COLUMNS = [
+    TableColumn("counter", "Zähler", cls="label"),
+    TableColumn("value", "Wert", fmt=fmt_number(), cls="num"),
+]
+
+ALL = "Alle"
+
+
+def show():
+    st.markdown("## ⏱ Performance")
+
+    rec = perf.recorder()
+    ops = perf.summary()
+    caches = perf.cache_ratios()
+    counters = rec.counters()
+    since = datetime.fromtimestamp(rec.started_at).strftime("%d.%m.%Y %H:%M")
+    st.caption(f"Messwerte dieses Server-Prozesses seit {since} · "
+               f"Ringpuffer {min(rec.recorded, rec.capacity):,}/{rec.capacity:,} Ereignisse")
+
+    if ops.empty:
+        st.markdown("""<div class="section-card" style="text-align:center; padding:40px;">
+            <div style="font-size:32px; margin-bottom:8px">⏱</div>
+            <div style="font-size:14px; color:#6b7280">Noch keine Messwerte vorhanden.</div>
+            <div style="font-size:13px; color:#9ca3af; margin-top:4px">Öffne eine Dashboard-Seite und komm zurück.</div>
+        </div>""", unsafe_allow_html=True)
+        return
+
+    # ── KPIs ──────────────────────────────────────────────────
+    pages = ops[ops["operation"].str.startswith("page.")]
+    page_p95 = pages["p95_ms"].max() if not pages.empty else float("nan")
+    lookups, hits = caches["lookups"].sum(), caches["hits"].sum()
+    hit_ratio = hits / lookups if lookups else float("nan")
+    errors = int(ops["errors"].sum())
+    queued, rejected = feedback_db.pending_writes(), counters.get("feedback.rejected", 0)
+    quota = sheets_quota()
+    if quota:
+        sheets_sub = (f"{quota['used_last_minute']}/{quota['limit_per_minute']} pro Minute · "
+                      f"{quota['retries']:,} Wiederholungen · {quota['throttled_seconds']:,.0f} s gedrosselt")
+        sheets_color = YELLOW if quota["used_last_minute"] >= 0.8 * quota["limit_per_minute"] else GREEN
+    else:
+        sheets_sub, sheets_color = f"{counters.get('sheets.retries', 0):,} Wiederholungen", ""
+
+    render_kpis(st.columns(5), [
+        {"label": "Seitenaufbau p95", "value": "–" if pd.isna(page_p95) else f"{page_p95:,.0f} ms",
+         "sub": "langsamste Seite", "trend_color": YELLOW},
+        {"label": "Sheets-API-Aufrufe", "value": f"{counters.get('sheets.api_calls', 0):,}",
+         "sub": sheets_sub, "trend_color": sheets_color},
+        {"label": "Cache-Trefferquote", "value": "–" if pd.isna(hit_ratio) else f"{hit_ratio:.0%}",
+         "sub": f"{lookups:,} Zugriffe", "trend_color": GREEN if hit_ratio >= 0.9 else YELLOW},
+        {"label": "Schreib-Warteschlange", "value": f"{queued:,}",
+         "sub": f"{rejected:,} abgelehnt" if rejected else "ausstehende Schreibvorgänge",
+         "trend_color": RED if rejected else YELLOW if queued else GREEN},
+        {"label": "Fehler", "value": str(errors), "trend_color": RED if errors else GREEN},
+    ])
+
+    st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
+
+    # ── Latency per operation ─────────────────────────────────
+    version = str(rec.recorded)
+    st.markdown("""<div class="section-card">
+        <div class="section-title">Latenz pro Operation</div>
+        <div class="section-sub">Perzentile über die Ereignisse im Ringpuffer</div>
+    </div>""", unsafe_allow_html=True)
+    groups = sorted(ops["operation"].str.split(".").str[0].unique())
+    fc1, fc2, fc3 = st.columns([1, 1, 2])
+    group = fc1.selectbox("Bereich", [ALL] + groups, key="perf_group")
+    sort_by = fc2.selectbox("Sortierung", ["p95_ms", "total_ms", "count", "operation"], key="perf_sort",
+                            format_func={"p95_ms": "p95", "total_ms": "Gesamtzeit", "count": "Aufrufe",
+                                         "operation": "Name"}.get)
+    if group != ALL:
+        ops = ops[ops["operation"].str.startswith(group + ".")]
+    ops = ops.sort_values(sort_by, ascending=sort_by == "operation", ignore_index=True)
+    render_table(f"perf-ops-{group}-{sort_by}", ops, OPERATION_COLUMNS, version)
+
+    with fc3:
+        st.write("")
+        ec1, ec2 = st.columns(2)
+        ec1.download_button("📥 JSON", perf.export_json, "performance.json", "application/json",
+                            use_container_width=True, key="perf_export")
+        if ec2.button("🗑 Zurücksetzen", use_container_width=True, key="perf_reset"):
+            rec.reset()
+            st.rerun()
+
+    # ── Caches + counters ─────────────────────────────────────
+    col_cache, col_counters = st.columns(2)
+    with col_cache:
+        st.markdown("""<div class="section-card">
+            <div class="section-title">Caches</div>
+            <div class="section-sub">Treffer = Zugriffe ohne Neuberechnung</div>
+        </div>""", unsafe_allow_html=True)
+        render_table("perf-caches", caches, CACHE_COLUMNS, version)
+
+    with col_counters:
+        st.markdown("""<div class="section-card">
+            <div class="section-title">Zähler</div>
+            <div class="section-sub">Seit Prozessstart bzw. letztem Zurücksetzen</div>
+        </div>""", unsafe_allow_html=True)
+        rows = {k: v for k, v in counters.items() if not k.startswith("cache.")}
+        reloads = reloader.stats()
+        reloads["saved_ms"] = round(reloads.pop("saved_seconds") * 1000)
+        rows.update({f"reloader.{k}": v for k, v in reloads.items()})
+        df_counters = pd.DataFrame(sorted(rows.items()), columns=["counter", "value"])
+        render_table("perf-counters", df_counters, COUNTER_COLUMNS, version)
@@ -0,0 +1,104 @@
+"""
+Memory / filter-speed benchmark: legacy vs. compact feedback table.
+
+Legacy = the frame the old _load_all built (object strings, int64,
+created_at as string, re-sorted on every get_feedback call).
+Compact = feedback_db._to_frame (categoricals, int8, datetime64,
+sorted once per snapshot).
+
+Usage (from streamlit/):
+    python scripts/bench_feedback_frame.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.feedback_db import _sort_newest_first, _to_frame  # noqa: E402
+
+PAGES = ["exec-summary", "market-uptake", "regional-view"]
+ELEMENTS = ["trx-chart", "revenue-chart", "nrx-rrx-chart", "market-share-chart",
+            "region-chart", "region-table", ""]
+
+
+def synthetic_columns(n: int, seed: int = 0) -> dict:
+    """Column-oriented synthetic feedback rows, as strings like the Sheet returns."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2025-01-01T00:00:00")
+    created = start + rng.integers(0, 365 * 24 * 3600, n).astype("timedelta64[s]")
+    return {
+        "id": [f"{i:012x}" for i in range(n)],
+        "page_id": rng.choice(PAGES, n).tolist(),
+        "element_id": rng.choice(ELEMENTS, n).tolist(),
+        "round": rng.integers(1, 6, n).tolist(),
+        "author": rng.choice([f"Tester {i}" for i in range(50)], n).tolist(),
+        "comment": rng.choice([f"Kommentar Nummer {i} zur Legende" for i in range(500)], n).tolist(),
+        "rating": rng.integers(1, 6, n).tolist(),
+        "status": rng.choice(["open", "resolved"], n).tolist(),
+        "created_at": np.datetime_as_string(created).tolist(),
+        "source": rng.choice(["streamlit", "react"], n).tolist(),
+    }
+
+
+def legacy_frame(cols: dict) -> pd.DataFrame:
+    df = pd.DataFrame(cols).astype(object)
+    df["round"] = pd.to_numeric(df["round"], errors="coerce").fillna(1).astype(int)
+    df["rating"] = pd.to_numeric(df["rating"], errors="coerce").fillna(3).astype(int)
+    df["id"] = df["id"].astype(str)
+    df["element_id"] = df["element_id"].replace("", None)
+    return df
+
+
+def legacy_filter(df, page_id, element_id, round_num, status):
+    df = df[(df["page_id"] == page_id) & (df["element_id"] == element_id)
+            & (df["round"] == round_num) & (df["status"] == status)]
+    return df.sort_values("created_at", ascending=False).reset_index(drop=True)
+
+
+def compact_filter(df, page_id, element_id, round_num, status):
+    df = df[(df["page_id"] == page_id) & (df["element_id"] == element_id)
+            & (df["round"] == round_num) & (df["status"] == status)]
+    return df.reset_index(drop=True)
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} | {'legacy MB':>9} | {'compact MB':>10} | "
+          f"{'legacy filter ms':>16} | {'compact filter ms':>17} | {'build s':>7}")
+    print("-" * 84)
+    for n in args.sizes:
+        cols = synthetic_columns(n)
+        legacy = legacy_frame(cols)
+        t0 = time.perf_counter()
+        compact = _sort_newest_first(_to_frame(cols))
+        build = time.perf_counter() - t0
+
+        query = ("market-uptake", "trx-chart", 3, "open")
+        t_legacy = best_of(lambda: legacy_filter(legacy, *query))
+        t_compact = best_of(lambda: compact_filter(compact, *query))
+        assert len(legacy_filter(legacy, *query)) == len(compact_filter(compact, *query))
+
+        mb = lambda df: df.memory_usage(deep=True).sum() / 1e6  # noqa: E731
+        print(f"{n:>9,} | {mb(legacy):>9.1f} | {mb(compact):>10.1f} | "
+              f"{t_legacy * 1000:>16.2f} | {t_compact * 1000:>17.2f} | {build:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
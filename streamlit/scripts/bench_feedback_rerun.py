@@ -0,0 +1,174 @@
+"""
+Rerun cost per feedback interaction: full script run vs. fragment rerun.
+
+Before the feedback widgets became fragments every submit or toggle ran
+the whole app (module check, sidebar, KPI cards, charts) and then a
+second time through ``st.rerun()``.  Now a widget inside a fragment only
+reruns that fragment.  For each interaction this script measures
+
+  full      the click followed by a full run of the script
+            (app.py on the Executive Summary; the overview page for the
+            admin list, as AppTest cannot switch to callable pages)
+  fragment  the same click followed by a run of only the fragment function,
+            which is what Streamlit executes for a fragment rerun
+
+Both go through AppTest, so both include the same harness overhead.
+Writes use the default write-behind queue; each one still republishes
+the feedback snapshot, which both variants pay for.
+Data comes from scripts/generate_data.py (synthetic dataset + SQLite
+feedback table), so no Google Sheets access is needed.
+
+Usage (from streamlit/):
+    python scripts/bench_feedback_rerun.py
+    python scripts/bench_feedback_rerun.py --feedback 200000 --repeat 10
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+sys.path.insert(0, str(APP_DIR / "scripts"))
+
+import generate_data  # noqa: E402
+
+PAGE = "exec-summary"
+ELEMENT = "trx-chart"
+
+_PAGE_FRAGMENT = f"""
+import sys
+sys.path.insert(0, {str(APP_DIR)!r})
+from lib import feedback_ui
+feedback_ui.page_feedback({PAGE!r})
+"""
+
+_ELEMENT_FRAGMENT = f"""
+import sys
+sys.path.insert(0, {str(APP_DIR)!r})
+from lib import feedback_ui
+feedback_ui.element_feedback({PAGE!r}, {ELEMENT!r}, "TRx")
+"""
+
+_OVERVIEW_PAGE = f"""
+import sys
+sys.path.insert(0, {str(APP_DIR)!r})
+from pages import feedback_overview
+feedback_overview.show()
+"""
+
+# The fragment keeps the frame of the last full run; so does this script
+_ADMIN_FRAGMENT = f"""
+import sys
+sys.path.insert(0, {str(APP_DIR)!r})
+import streamlit as st
+from lib import feedback_db
+from pages import feedback_overview
+if "bench_df" not in st.session_state:
+    st.session_state["bench_df"] = feedback_db.get_feedback(order="export")
+feedback_overview._entries(st.session_state["bench_df"], {{}}, "")
+"""
+
+
+def _app(source: str = None):
+    from streamlit.testing.v1 import AppTest
+
+    if source is None:
+        at = AppTest.from_file(str(APP_DIR / "app.py"), default_timeout=600)
+    else:
+        at = AppTest.from_string(source, default_timeout=600)
+    _run(at)
+    return at
+
+
+def _run(at) -> float:
+    t0 = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def _toggle_page(at):
+    [b for b in at.button if b.key and b.key.startswith(f"toggle_{PAGE}_")][0].click()
+
+
+def _submit_page(at):
+    at.text_input(key=f"pf_{PAGE}_a").input("Bench")
+    at.text_area(key=f"pf_{PAGE}_c").input("Kommentar aus dem Benchmark")
+    [b for b in at.button if b.label == "📩 Absenden"][0].click()
+
+
+def _submit_element(at):
+    prefix = f"ef_{PAGE}_{ELEMENT}"
+    at.text_input(key=f"{prefix}_a").input("Bench")
+    at.text_area(key=f"{prefix}_c").input("Kommentar aus dem Benchmark")
+    [b for b in at.button if b.label == "Absenden"][0].click()
+
+
+def _toggle_admin(at):
+    [b for b in at.button if b.key and b.key.startswith("admin_toggle_")][0].click()
+
+
+# Interaction → (action, script for the full run, script for the fragment run)
+INTERACTIONS = {
+    "rerun, no write": (lambda at: None, None, _PAGE_FRAGMENT),
+    "page toggle": (_toggle_page, None, _PAGE_FRAGMENT),
+    "page submit": (_submit_page, None, _PAGE_FRAGMENT),
+    "element submit": (_submit_element, None, _ELEMENT_FRAGMENT),
+    "admin toggle": (_toggle_admin, _OVERVIEW_PAGE, _ADMIN_FRAGMENT),
+}
+
+
+def measure(action, source: str, repeat: int) -> float:
+    """Median seconds of ``repeat`` (action + run) cycles on a warm app."""
+    at = _app(source)
+    _run(at)
+    times = []
+    for _ in range(repeat):
+        action(at)
+        times.append(_run(at))
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--feedback", type=int, default=20_000, help="feedback rows")
+    parser.add_argument("--repeat", type=int, default=5, help="interactions per measurement")
+    args = parser.parse_args()
+
+    os.chdir(APP_DIR)
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="bench-rerun-") as tmp:
+        out = Path(tmp)
+        source = generate_data.write_dataset(generate_data.generate_dataset(36, 200, 5), out)
+        generate_data.write_feedback(out / "feedback.db", args.feedback)
+        os.environ.update({
+            "DATA_SOURCE": str(source),
+            "DATA_CACHE_DIR": str(out / "cache"),
+            "FEEDBACK_BACKEND": "sqlite",
+            "FEEDBACK_SQLITE_PATH": str(out / "feedback.db"),
+            "FEEDBACK_JOURNAL_DIR": str(out / "journal"),
+        })
+        print(f"… {args.feedback:,} feedback rows, {args.repeat} interactions each", file=sys.stderr)
+        for name, (action, full_source, fragment_source) in INTERACTIONS.items():
+            full = measure(action, full_source, args.repeat)
+            fragment = measure(action, fragment_source, args.repeat)
+            rows.append((name, full * 1000, fragment * 1000))
+
+        # Flush queued writes before the temporary directory goes away
+        from lib import feedback_db
+        feedback_db._store().queue().drain()
+
+    print(f"{'interaction':<16} {'full ms':>9} {'fragment ms':>12} {'share':>7}")
+    for name, full, fragment in rows:
+        print(f"{name:<16} {full:>9.0f} {fragment:>12.0f} {fragment / full:>7.0%}")
+    print("(before: every interaction cost two full runs, the click and st.rerun())")
+
+
+if __name__ == "__main__":
+    main()
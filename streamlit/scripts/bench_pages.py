@@ -0,0 +1,143 @@
+"""
+Page-render benchmark: runs each page's ``show()`` headlessly at several
+data sizes and reports wall time, peak memory and elements emitted.
+
+Each size gets a synthetic dataset and a SQLite feedback table from
+scripts/generate_data.py, so no Google Sheets access is needed.  Pages
+run through Streamlit's AppTest; the first run per size is cold (data
+parsed, caches empty), the reported time is the median of the warm runs.
+Peak memory comes from one extra run under tracemalloc, which is kept
+out of the timings because it slows allocation-heavy code down.
+
+Usage (from streamlit/):
+    python scripts/bench_pages.py                       # small, medium, large
+    python scripts/bench_pages.py --size small --repeat 5
+    python scripts/bench_pages.py --page exec_summary --page regional_view
+    python scripts/bench_pages.py --months 120 --regions 400 --products 20 --feedback 200000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+sys.path.insert(0, str(APP_DIR / "scripts"))
+
+import generate_data  # noqa: E402
+
+PAGES = ["pages.exec_summary", "pages.market_uptake",
+         "pages.regional_view", "pages.feedback_overview"]
+
+# months, regions, products, feedback rows
+SIZES = {
+    "small": (8, 17, 1, 200),
+    "medium": (36, 200, 5, 20_000),
+    "large": (120, 1_000, 20, 200_000),
+}
+
+_SCRIPT = """
+import sys
+sys.path.insert(0, {app_dir!r})
+import {module}
+{module}.show()
+"""
+
+
+def _count_elements(node) -> int:
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return sum(_count_elements(child) for child in children.values())
+
+
+def run_page(module: str, trace: bool = False) -> tuple:
+    """Render ``module`` once; return (seconds, peak bytes or 0, element count)."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(_SCRIPT.format(app_dir=str(APP_DIR), module=module),
+                             default_timeout=600)
+    if trace:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - t0
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if at.exception:
+        raise RuntimeError(f"{module}: {at.exception[0].message}")
+    return elapsed, peak, _count_elements(at._tree)
+
+
+def bench(label: str, size: tuple, pages: list, repeat: int, workdir: Path) -> list:
+    months, regions, products, feedback = size
+    out = workdir / label
+    data = generate_data.generate_dataset(months, regions, products)
+    source = generate_data.write_dataset(data, out)
+    generate_data.write_feedback(out / "feedback.db", feedback)
+    os.environ.update({
+        "DATA_SOURCE": str(source),
+        "DATA_CACHE_DIR": str(out / "cache"),
+        "FEEDBACK_BACKEND": "sqlite",
+        "FEEDBACK_SQLITE_PATH": str(out / "feedback.db"),
+        "FEEDBACK_JOURNAL_DIR": str(out / "journal"),
+    })
+
+    results = []
+    for module in pages:
+        cold, _, elements = run_page(module)
+        warm = [run_page(module)[0] for _ in range(repeat)]
+        _, peak, _ = run_page(module, trace=True)
+        results.append({
+            "size": label, "page": module.split(".", 1)[1],
+            "cold_ms": cold * 1000,
+            "warm_ms": statistics.median(warm) * 1000 if warm else float("nan"),
+            "peak_mb": peak / 1e6,
+            "elements": elements,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", choices=sorted(SIZES), action="append",
+                        help="preset size(s) (default: all)")
+    parser.add_argument("--page", choices=[p.split(".", 1)[1] for p in PAGES],
+                        action="append", help="page(s) to render (default: all)")
+    parser.add_argument("--months", type=int)
+    parser.add_argument("--regions", type=int)
+    parser.add_argument("--products", type=int)
+    parser.add_argument("--feedback", type=int)
+    parser.add_argument("--repeat", type=int, default=3, help="warm runs per page")
+    args = parser.parse_args()
+
+    os.chdir(APP_DIR)
+    if args.months or args.regions or args.products or args.feedback:
+        base = SIZES["small"]
+        sizes = {"custom": (args.months or base[0], args.regions or base[1],
+                            args.products or base[2], args.feedback or base[3])}
+    else:
+        sizes = {name: SIZES[name] for name in args.size or SIZES}
+
+    pages = [f"pages.{p}" for p in args.page] if args.page else PAGES
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="bench-pages-") as tmp:
+        for label, size in sizes.items():
+            print(f"… {label}: {size[0]} months, {size[1]} regions, "
+                  f"{size[2]} products, {size[3]:,} feedback rows", file=sys.stderr)
+            rows += bench(label, size, pages, args.repeat, Path(tmp))
+
+    print(f"{'size':<8} {'page':<18} {'cold ms':>9} {'warm ms':>9} {'peak MB':>9} {'elements':>9}")
+    for r in rows:
+        print(f"{r['size']:<8} {r['page']:<18} {r['cold_ms']:>9.0f} {r['warm_ms']:>9.0f} "
+              f"{r['peak_mb']:>9.1f} {r['elements']:>9}")
+
+
+if __name__ == "__main__":
+    main()
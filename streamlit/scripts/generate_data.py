@@ -0,0 +1,165 @@
+"""
+Synthetic data generator for load tests and benchmarks.
+
+Writes a dataset the app can load via the ``[data] source`` setting
+(mock-data.json layout, or a CSV drop directory) and optionally a
+feedback table as a SQLite file for the "sqlite" feedback backend.
+
+Usage (from streamlit/):
+    python scripts/generate_data.py OUT_DIR --months 60 --regions 200 \\
+        --products 10 --feedback 50000 [--format csv]
+
+Then run the app against it:
+    DATA_SOURCE=OUT_DIR/mock-data.json FEEDBACK_BACKEND=sqlite \\
+    FEEDBACK_SQLITE_PATH=OUT_DIR/feedback.db streamlit run app.py
+"""
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lib.feedback_backends import COLUMNS, SQLiteBackend  # noqa: E402
+from lib.feedback_ids import base36  # noqa: E402
+
+COMPETITORS = ["forxiga", "jardiance", "invokana"]
+PAGE_ELEMENTS = {
+    "exec-summary": ["trx-chart", "revenue-chart"],
+    "market-uptake": ["nrx-rrx-chart", "market-share-chart"],
+    "regional-view": ["region-chart", "region-table"],
+}
+WORDS = ("Legende Farben Achse Tooltip Filter Zeitraum Vergleich Plan Ist Region "
+         "Marktanteil Übersicht Größe Schriftart Beschriftung Sortierung Export "
+         "unklar super fehlt zu klein zu groß bitte ändern prüfen").split()
+
+
+def generate_dataset(months: int, regions: int, products: int, seed: int = 0) -> dict:
+    """Return a dict in mock-data.json layout (monthly/regions/competitors/kpis).
+
+    The app expects one ``monthly`` row per month, so ``monthly`` and
+    ``kpis`` describe the primary product only; further products widen
+    the competitor market-share table.
+    """
+    rng = np.random.default_rng(seed)
+    month_keys = [str(p) for p in pd.period_range("2025-05", periods=months, freq="M")]
+
+    monthly = []
+    trx = np.cumsum(rng.integers(20, 120, months)) + 300
+    plan = (trx * rng.uniform(0.9, 1.1, months)).astype(int)
+    nrx = (trx * rng.uniform(0.3, 0.7, months)).astype(int)
+    for i, month in enumerate(month_keys):
+        monthly.append({
+            "month": month, "product": "Cardiozan",
+            "trx": int(trx[i]), "trx_plan": int(plan[i]),
+            "trx_upper": int(plan[i] * 1.15), "trx_lower": int(plan[i] * 0.85),
+            "nrx": int(nrx[i]), "rrx": int(trx[i] - nrx[i]),
+            "net_revenue": int(trx[i] * 70), "net_plan": int(plan[i] * 70),
+            "gross_revenue": int(trx[i] * 89),
+            "prescribers": int(15 + i * 2 + rng.integers(0, 5)),
+        })
+
+    region_rows = []
+    for i in range(regions):
+        trx = int(rng.integers(50, 600))
+        plan = int(trx * rng.uniform(0.7, 1.4))
+        region_rows.append({
+            "region": f"Region {i + 1:03d}", "trx": trx, "trx_plan": plan,
+            "net_revenue": trx * 71, "net_plan": plan * 71,
+            "prescribers": int(rng.integers(1, 30)),
+            "market_share": round(float(rng.uniform(2, 35)), 1),
+        })
+
+    competitors = []
+    extra = [f"produkt_{i}" for i in range(2, products + 1)]
+    for i, month in enumerate(month_keys):
+        shares = rng.dirichlet(np.ones(4 + len(extra))) * 100
+        row = {"month": month}
+        for name, share in zip(COMPETITORS + ["cardiozan"] + extra, shares):
+            row[name] = round(float(share), 1)
+        competitors.append(row)
+
+    kpis = {
+        "cumulative_net_revenue": sum(m["net_revenue"] for m in monthly),
+        "cumulative_trx": sum(m["trx"] for m in monthly),
+        "active_prescribers": monthly[-1]["prescribers"],
+        "market_share_latest": competitors[-1]["cardiozan"],
+    }
+    return {"monthly": monthly, "regions": region_rows, "competitors": competitors, "kpis": kpis}
+
+
+def write_dataset(data: dict, out_dir: Path, fmt: str = "json") -> Path:
+    """Write the dataset; returns the path to use as ``[data] source``."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        for name in ("monthly", "regions", "competitors"):
+            pd.DataFrame(data[name]).to_csv(out_dir / f"{name}.csv", index=False)
+        (out_dir / "kpis.json").write_text(json.dumps(data["kpis"]), encoding="utf-8")
+        return out_dir
+    path = out_dir / "mock-data.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def feedback_rows(n: int, rounds: int = 5, seed: int = 0) -> list:
+    """Synthetic feedback rows in COLUMNS order."""
+    rng = np.random.default_rng(seed)
+    pages = list(PAGE_ELEMENTS)
+    start = datetime(2025, 5, 1)
+    rows = []
+    for i in range(n):
+        page = pages[rng.integers(len(pages))]
+        elements = PAGE_ELEMENTS[page] + [""]
+        created = start + timedelta(seconds=int(i * 3600 * 24 * 365 / max(n, 1)))
+        rows.append([
+            # Same layout as feedback_ids; the row number stands in for counter + random
+            base36(int(created.timestamp() * 1000), 8) + base36(i % 36 ** 5, 5),
+            page,
+            elements[rng.integers(len(elements))],
+            int(rng.integers(1, rounds + 1)),
+            f"Tester {rng.integers(1, 60)}",
+            " ".join(rng.choice(WORDS, int(rng.integers(4, 16)))).capitalize(),
+            int(rng.integers(1, 6)),
+            "resolved" if rng.random() < 0.4 else "open",
+            created.isoformat(),
+            "react" if rng.random() < 0.5 else "streamlit",
+        ])
+    return rows
+
+
+def write_feedback(path: Path, n: int, seed: int = 0) -> Path:
+    """Create a SQLite feedback file with ``n`` rows (replaces an existing one)."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+    backend = SQLiteBackend(path)
+    rows = feedback_rows(n, seed=seed)
+    for i in range(0, len(rows), 10_000):
+        backend.append_rows(rows[i:i + 10_000])
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--regions", type=int, default=17)
+    parser.add_argument("--products", type=int, default=1, help="products in the market-share table")
+    parser.add_argument("--feedback", type=int, default=0, help="feedback rows (SQLite)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = generate_dataset(args.months, args.regions, args.products, args.seed)
+    source = write_dataset(data, args.out_dir, args.format)
+    print(f"data:     {source}")
+    if args.feedback:
+        db = write_feedback(args.out_dir / "feedback.db", args.feedback, args.seed)
+        print(f"feedback: {db} ({args.feedback:,} rows, columns: {', '.join(COLUMNS)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Import-time profile of the Streamlit app (cold start budget check).
+
+Runs ``python -X importtime`` in a fresh interpreter for each target and
+reports the slowest modules.  The default "startup" target imports what
+app.py loads before the first page is drawn; pages and lazy features are
+profiled separately so their cost stays visible.
+
+Usage (from streamlit/):
+    python scripts/profile_imports.py                  # report only
+    python scripts/profile_imports.py --budget-ms 1500 # exit 1 if startup is slower
+    python scripts/profile_imports.py --target pages.exec_summary --top 25
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# What app.py imports at module level (pages, gspread and openpyxl are lazy)
+STARTUP = ["streamlit", "lib.reloader", "lib.mock_data", "lib.theme",
+           "lib.feedback_db", "lib.feedback_ui"]
+
+TARGETS = {
+    "startup": STARTUP,
+    "pages.exec_summary": ["pages.exec_summary"],
+    "pages.market_uptake": ["pages.market_uptake"],
+    "pages.regional_view": ["pages.regional_view"],
+    "pages.feedback_overview": ["pages.feedback_overview"],
+    "sheets": ["lib.sheets_client"],
+    "excel": ["openpyxl"],
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def profile(modules: list, preload: list = ()) -> list:
+    """Return (module, self_us, cumulative_us, depth) for a cold import of ``modules``.
+
+    ``preload`` is imported first and excluded, so only the extra cost shows.
+    """
+    code = "".join(f"import {m}\n" for m in preload)
+    code += "import sys; sys.stderr.write('--- profile ---\\n')\n"
+    code += "".join(f"import {m}\n" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr)
+    stderr = proc.stderr.split("--- profile ---\n", 1)[-1]
+    rows = []
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target", choices=sorted(TARGETS), action="append",
+                        help="target(s) to profile (default: all)")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to list")
+    parser.add_argument("--budget-ms", type=float,
+                        help="fail (exit 1) when the startup import time exceeds this")
+    args = parser.parse_args()
+
+    failed = False
+    for name in args.target or list(TARGETS):
+        # Everything except startup is measured on top of an already started app
+        preload = [] if name == "startup" else STARTUP
+        rows = profile(TARGETS[name], preload)
+        total_ms = sum(r[2] for r in rows if r[3] == 0) / 1000
+        print(f"\n== {name}: {total_ms:.0f} ms ({len(rows)} modules)")
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for mod, self_us, cum_us, _ in sorted(rows, key=lambda r: -r[1])[:args.top]:
+            print(f"{cum_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {mod}")
+        if name == "startup" and args.budget_ms is not None and total_ms > args.budget_ms:
+            print(f"!! startup import time {total_ms:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from lib.feedback_journal import Journal
+
+
+def test_append_after_torn_tail_keeps_both_entries(tmp_path):
+    journal = Journal(tmp_path, name="sqlite")
+    journal.append({"op": "append", "row": ["a"]})
+    journal.close()
+    # Crash in the middle of writing the next entry
+    with open(tmp_path / "sqlite-0.jsonl", "ab") as f:
+        f.write(b'{"seq": 2, "op": "app')
+
+    journal = Journal(tmp_path, name="sqlite")
+    journal.append({"op": "append", "row": ["b"]})
+    journal.close()
+
+    journal = Journal(tmp_path, name="sqlite")
+    assert [e["row"] for e in journal.pending()] == [["a"], ["b"]]
+    journal.close()
+
+
+def test_unterminated_last_entry_is_kept(tmp_path):
+    journal = Journal(tmp_path, name="sqlite")
+    journal.close()
+    # Complete JSON, but the newline never made it to disk
+    (tmp_path / "sqlite-0.jsonl").write_bytes(b'{"seq": 1, "op": "append", "row": ["a"], "ts": 0}')
+
+    journal = Journal(tmp_path, name="sqlite")
+    journal.append({"op": "append", "row": ["b"]})
+    journal.close()
+
+    journal = Journal(tmp_path, name="sqlite")
+    assert [e["row"] for e in journal.pending()] == [["a"], ["b"]]
+    journal.close()